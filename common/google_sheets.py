@@ -1,7 +1,8 @@
 # Placeholder for Google Sheets integration utilities
 
 import gspread
-from typing import List, Dict, Any
+from gspread.utils import numericise_all, rowcol_to_a1
+from typing import List, Dict, Any, Iterator
 from datetime import datetime
 from urllib.parse import urlparse
 import logging
@@ -22,11 +23,57 @@ class GoogleSheetsClient:
         self.gc = gspread.service_account(filename=credentials_json)
         self.sheet = self.gc.open_by_key(sheet_id)
         self.worksheet = self.sheet.worksheet(worksheet_name)
+        self._worksheets = {worksheet_name: self.worksheet}
+        self._columns = {}  # worksheet name -> {header: 1-based column index}
+
+    def _get_worksheet(self, sheet_name: str):
+        """Return a worksheet handle, opening it only on first use."""
+        if sheet_name not in self._worksheets:
+            self._worksheets[sheet_name] = self.sheet.worksheet(sheet_name)
+        return self._worksheets[sheet_name]
+
+    def _get_columns(self, sheet_name: str) -> Dict[str, int]:
+        """Return the header -> column index map, reading the header row only once."""
+        if sheet_name not in self._columns:
+            headers = self._get_worksheet(sheet_name).row_values(1)
+            columns = {}
+            for i, h in enumerate(headers):
+                columns.setdefault(h, i + 1)  # first match wins, like list.index
+            self._columns[sheet_name] = columns
+        return self._columns[sheet_name]
 
     def get_rows(self) -> List[Dict[str, Any]]:
         records = self.worksheet.get_all_records()
         return records
 
+    def iter_rows(self, page_size: int = 200) -> Iterator[Dict[str, Any]]:
+        """Lazily yield rows as dicts, fetching the sheet one page at a time.
+
+        Args:
+            page_size (int): Rows requested by the first range call; each
+                later call asks for twice as many as the one before
+
+        Returns:
+            Iterator[Dict[str, Any]]: Row dicts keyed by the header row
+        """
+        headers = self.worksheet.row_values(1)
+        if not headers:
+            return
+        # The API trims trailing blank rows from each range, so an empty page
+        # can still sit before more data; only the grid size (1000 rows by
+        # default) bounds the scan. Pages double in size so reaching the end
+        # of a mostly empty grid takes a handful of calls, not one per page.
+        row_count = self.worksheet.row_count
+        start = 2  # row 1 is header
+        while start <= row_count:
+            end = min(start + page_size - 1, row_count)
+            for row in self.worksheet.get(f"{start}:{end}"):
+                # Numericise like get_all_records so callers see the same types
+                row = numericise_all(row)
+                yield dict(zip(headers, row + [''] * (len(headers) - len(row))))
+            start = end + 1
+            page_size *= 2
+
     def is_valid_url(self, url: str) -> bool:
         if not isinstance(url, str):
             logger.warning(f"URL is not a string: {url}")
@@ -93,26 +140,32 @@ class GoogleSheetsClient:
         """Update specific cells in a row."""
         try:
             # Get the worksheet
-            worksheet = self.sheet.worksheet(sheet_name)
+            worksheet = self._get_worksheet(sheet_name)
             if not worksheet:
                 logger.error(f"Worksheet {sheet_name} not found")
                 return
 
-            # Get the header row to map column names to indices
-            headers = worksheet.row_values(1)
+            # Map column names to indices from the cached header row
+            columns = self._get_columns(sheet_name)
             
             # Get the sno value for logging
-            sno_col_index = headers.index('sno') + 1 if 'sno' in headers else None
+            sno_col_index = columns.get('sno')
             sno_value = worksheet.cell(row_index + 1, sno_col_index).value if sno_col_index else 'N/A'
             
-            # Update each specified cell
+            # Collect every specified cell and write them in one request
+            batch = []
             for col_name, value in updates.items():
-                if col_name in headers:
-                    col_index = headers.index(col_name) + 1  # +1 because sheets is 1-indexed
-                    worksheet.update_cell(row_index + 1, col_index, value)
-                    logger.info(f"Updated {sheet_name} - Row {sno_value} with field {col_name}: {value}")
+                col_index = columns.get(col_name)
+                if col_index:
+                    batch.append({'range': rowcol_to_a1(row_index + 1, col_index), 'values': [[value]]})
                 else:
                     logger.warning(f"Column {col_name} not found in {sheet_name}")
+            if batch:
+                # Match update_cell, which lets Sheets parse timestamps and numbers
+                worksheet.batch_update(batch, value_input_option='USER_ENTERED')
+                for col_name, value in updates.items():
+                    if col_name in columns:
+                        logger.debug(f"Updated {sheet_name} - Row {sno_value} with field {col_name}: {value}")
             
             logger.info(f"Updated {sheet_name} - Row {sno_value} with {len(updates)} fields")
             
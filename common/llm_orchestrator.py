@@ -1,6 +1,8 @@
 import os
+import asyncio
 from openai import OpenAI
 import aiohttp
+import orjson
 import logging
 
 logger = logging.getLogger(__name__)
@@ -30,8 +32,7 @@ class LLMOrchestrator:
     async def _generate_openai(self, prompt: str, model: str):
         try:
             # OpenAI's create method is not async, so we need to run it in a thread pool
-            import asyncio
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             response = await loop.run_in_executor(
                 None,
                 lambda: self.client.chat.completions.create(
@@ -51,7 +52,7 @@ class LLMOrchestrator:
                 payload = {"model": model, "prompt": prompt}
                 async with session.post(url, json=payload) as response:
                     response.raise_for_status()
-                    data = await response.json()
+                    data = orjson.loads(await response.read())
                     return data.get('response', '')
         except Exception as e:
             logger.error(f"Error generating content with Ollama: {str(e)}")
@@ -2,9 +2,17 @@ import time
 import random
 import logging
 import asyncio
+import functools
+import aiohttp
 
 logger = logging.getLogger(__name__)
 
+# Rate limiting and transient server errors that are worth retrying
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Non-idempotent writes may already be committed behind a 5xx, so only a rate limit is safe to replay
+WRITE_RETRYABLE_STATUSES = frozenset({429})
+
 async def retry_with_backoff(fn, max_retries=3, base_delay=1):
     for attempt in range(max_retries):
         try:
@@ -14,4 +22,31 @@ async def retry_with_backoff(fn, max_retries=3, base_delay=1):
                 raise
             delay = base_delay * (2 ** attempt) + random.uniform(0, 1)
             logger.warning(f"Attempt {attempt + 1} failed: {str(e)}. Retrying in {delay:.2f} seconds...")
-            await asyncio.sleep(delay) 
\ No newline at end of file
+            await asyncio.sleep(delay)
+
+def retry_on_http_error(max_retries=3, base_delay=0.5, statuses=RETRYABLE_STATUSES):
+    """Decorate a coroutine to retry on retryable aiohttp response errors.
+
+    Sleeps for the server's Retry-After value when one is sent, otherwise
+    backs off exponentially with a little jitter. Pass
+    statuses=WRITE_RETRYABLE_STATUSES for requests that must not be replayed
+    after a server error.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            for attempt in range(max_retries + 1):
+                try:
+                    return await fn(*args, **kwargs)
+                except aiohttp.ClientResponseError as e:
+                    if e.status not in statuses or attempt == max_retries:
+                        raise
+                    retry_after = e.headers.get('Retry-After') if e.headers else None
+                    try:
+                        delay = float(retry_after)
+                    except (TypeError, ValueError):
+                        delay = base_delay * (2 ** attempt) + random.uniform(0, 0.1)
+                    logger.warning(f"{fn.__name__} got HTTP {e.status}, retrying in {delay:.2f} seconds ({attempt + 1}/{max_retries})")
+                    await asyncio.sleep(delay)
+        return wrapper
+    return decorator
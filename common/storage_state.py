@@ -0,0 +1,18 @@
+import os
+import json
+
+async def save_storage_state(context, path: str):
+    """Write a Playwright context's storage state to path, readable only by the owner.
+
+    Session cookies are as good as the password, so the file is created 0600
+    and swapped in whole rather than chmod-ed after the write.
+    """
+    state = await context.storage_state()
+    state_dir = os.path.dirname(path)
+    if state_dir:
+        os.makedirs(state_dir, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w') as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
@@ -28,6 +28,25 @@ sys.path.append(project_root)
 running = True
 # Global Twitter instance to keep sessions open
 global_twitter = None
+# Strong references to fire-and-forget tasks; the loop only keeps weak ones
+background_tasks = set()
+
+def spawn_background(coro) -> asyncio.Task:
+    """Start coro as a task that stays referenced until it finishes."""
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return task
+
+async def finish_background_tasks(cancel: set = frozenset()):
+    """Cancel the given tasks, wait for every background task and log their failures."""
+    for task in cancel:
+        task.cancel()
+    tasks = list(background_tasks)
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    for task, result in zip(tasks, results):
+        if isinstance(result, Exception):
+            logger.error(f"Background task {task.get_name()} failed: {str(result)}")
 
 def signal_handler(signum, frame):
     """Handle shutdown signals."""
@@ -36,7 +55,7 @@ def signal_handler(signum, frame):
     running = False
     # Close Twitter sessions on shutdown
     if global_twitter:
-        asyncio.create_task(global_twitter.close_session())
+        spawn_background(global_twitter.close_session())
 
 def load_config():
     """Load configuration from environment variables."""
@@ -75,6 +94,7 @@ async def run_workflow():
     """Run the social media workflow."""
     global global_twitter
     session = None
+    warm_up_task = None
     try:
         # Initialize server parameters
         server_params = StdioServerParameters(
@@ -116,8 +136,10 @@ async def run_workflow():
                 logger.info(f"Workflow will run every {interval_minutes} minutes")
                 
                 # Initialize global Twitter instance once
-                from mcp_server.tools.multi_twitter import MultiTwitterPlaywright
-                global_twitter = MultiTwitterPlaywright()
+                from mcp_server.tools.multi_twitter import get_twitter
+                global_twitter = get_twitter()
+                # Launch Chromium in the background while the first workflow run starts
+                warm_up_task = spawn_background(global_twitter.warm_up())
                 logger.info("Initialized global Twitter instance with persistent sessions")
                 
                 while running:
@@ -150,21 +172,15 @@ async def run_workflow():
                             twitter_like_count = int(os.getenv('TWITTER_LIKE_COUNT', '10'))
                             likes_per_account = twitter_like_count // 2
                             
-                            # Engage with primary account using primary search terms
+                            # Engage with both accounts at once, each with its own search terms
                             logger.info(f"Primary account using search term: {primary_search_term}")
-                            primary_success = await global_twitter.search_and_like_tweets(
-                                search_term=primary_search_term, 
-                                max_likes=likes_per_account, 
-                                account_name='primary'
-                            )
-                            
-                            # Engage with secondary account using secondary search terms
                             logger.info(f"Secondary account using search term: {secondary_search_term}")
-                            secondary_success = await global_twitter.search_and_like_tweets(
-                                search_term=secondary_search_term, 
-                                max_likes=likes_per_account, 
-                                account_name='secondary'
+                            results = await global_twitter.search_and_like_all(
+                                {'primary': primary_search_term, 'secondary': secondary_search_term},
+                                max_likes=likes_per_account
                             )
+                            primary_success = results['primary']
+                            secondary_success = results['secondary']
                             
                             if primary_success:
                                 logger.info(f"Primary Twitter account engagement completed with {likes_per_account} likes")
@@ -250,6 +266,9 @@ async def run_workflow():
         logger.error(f"Error running workflow: {str(e)}", exc_info=True)
         raise
     finally:
+        # A still-running warm-up is no longer needed; a signal-triggered close is awaited
+        await finish_background_tasks({warm_up_task} if warm_up_task else set())
+        
         # Close Twitter sessions on final cleanup
         if global_twitter:
             try:
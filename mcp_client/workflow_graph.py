@@ -16,9 +16,9 @@ from typing import Dict, Any
 from common.google_sheets import GoogleSheetsClient
 from common.llm_orchestrator import LLMOrchestrator
 from common.retry_utils import retry_with_backoff
-from mcp_server.tools.extract_content import ExtractContent
+from mcp_server.tools.extract_content import get_extractor
 from mcp_server.tools.store_tweets import StoreTweets
-from mcp_server.tools.multi_twitter import MultiTwitterPlaywright
+from mcp_server.tools.multi_twitter import get_twitter
 from mcp_server.tools.bsky import BlueskyAPI
 from mcp_server.tools.schedule_post import SchedulePost
 from mcp_server.tools.telegram_post import TelegramPoster
@@ -56,9 +56,9 @@ class WorkflowGraph:
         logger.info(f"Initializing GoogleSheetsClient with sheet ID: {sheet_id}")
         self.sheets = GoogleSheetsClient(credentials_path, sheet_id)
         self.llm = LLMOrchestrator(provider="openai")
-        self.extractor = ExtractContent()
+        self.extractor = get_extractor()
         self.tweet_storer = StoreTweets(self.sheets)
-        self.twitter = MultiTwitterPlaywright()
+        self.twitter = get_twitter()
         self.bsky = BlueskyAPI()
         self.scheduler = SchedulePost(self.sheets)
         self.telegram = TelegramPoster()
@@ -413,15 +413,16 @@ class WorkflowGraph:
         try:
             # Post each tweet with both accounts
             for tweet in tweets:
-                # Post with primary account
-                primary_success = await self.twitter.post_tweet(tweet['text'], 'primary')
+                # Post with both accounts at once
+                results = await self.twitter.post_tweet_all(tweet['text'])
+                primary_success = results['primary']
+                secondary_success = results['secondary']
+                
                 if primary_success:
                     logger.info(f"Tweet posted successfully with primary account")
                 else:
                     logger.warning(f"Failed to post tweet with primary account")
                 
-                # Post with secondary account
-                secondary_success = await self.twitter.post_tweet(tweet['text'], 'secondary')
                 if secondary_success:
                     logger.info(f"Tweet posted successfully with secondary account")
                 else:
@@ -586,29 +587,24 @@ class WorkflowGraph:
         try:
             logger.info(f"Engaging with Twitter posts using separate search terms for each account")
             
-            # Engage with primary account using primary search terms
+            # Engage with both accounts at once, each with its own search terms
             primary_search_term = self.get_random_search_term('primary')
             logger.info(f"Primary account using search term: {primary_search_term}")
+            secondary_search_term = self.get_random_search_term('secondary')
+            logger.info(f"Secondary account using search term: {secondary_search_term}")
             
-            primary_success = await self.twitter.search_and_like_tweets(
-                search_term=primary_search_term, 
-                max_likes=3, 
-                account_name='primary'
+            results = await self.twitter.search_and_like_all(
+                {'primary': primary_search_term, 'secondary': secondary_search_term},
+                max_likes=3
             )
+            primary_success = results['primary']
+            secondary_success = results['secondary']
+            
             if primary_success:
                 logger.info("Primary Twitter account engagement completed")
             else:
                 logger.warning("Primary Twitter account engagement failed")
             
-            # Engage with secondary account using secondary search terms
-            secondary_search_term = self.get_random_search_term('secondary')
-            logger.info(f"Secondary account using search term: {secondary_search_term}")
-            
-            secondary_success = await self.twitter.search_and_like_tweets(
-                search_term=secondary_search_term, 
-                max_likes=3, 
-                account_name='secondary'
-            )
             if secondary_success:
                 logger.info("Secondary Twitter account engagement completed")
             else:
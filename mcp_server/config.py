@@ -1,4 +1,6 @@
 import os
+from dataclasses import dataclass
+from typing import Optional
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -8,4 +10,21 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
 BLUESKY_API_KEY = os.getenv("BLUESKY_API_KEY")
 TWITTER_USERNAME = os.getenv("TWITTER_USERNAME")
-TWITTER_PASSWORD = os.getenv("TWITTER_PASSWORD") 
\ No newline at end of file
+TWITTER_PASSWORD = os.getenv("TWITTER_PASSWORD")
+
+@dataclass(frozen=True)
+class Settings:
+    """Snapshot of the environment taken after .env has been loaded."""
+    google_sheet_id: Optional[str] = None
+    google_sheets_credentials: Optional[str] = None
+    telegram_bot_token: Optional[str] = None
+    telegram_channel: Optional[str] = None
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        return cls(
+            google_sheet_id=os.getenv("GOOGLE_SHEET_ID"),
+            google_sheets_credentials=os.getenv("GOOGLE_SHEETS_CREDENTIALS"),
+            telegram_bot_token=os.getenv("TELEGRAM_BOT_TOKEN"),
+            telegram_channel=os.getenv("TELEGRAM_CHANNEL"),
+        )
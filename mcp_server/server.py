@@ -6,10 +6,10 @@ import asyncio
 import random
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
-from mcp_server.tools.extract_content import ExtractContent
+from mcp_server.tools.extract_content import get_extractor
 from mcp_server.tools.store_tweets import StoreTweets
-from mcp_server.tools.multi_twitter import MultiTwitterPlaywright
-from mcp_server.tools.bsky import BlueskyAPI
+from mcp_server.tools.multi_twitter import get_twitter
+from mcp_server.tools.bsky import BlueskyAPI, close_session as close_bsky_session
 from mcp_server.tools.schedule_post import SchedulePost
 from common.google_sheets import GoogleSheetsClient
 from common.llm_orchestrator import LLMOrchestrator
@@ -70,9 +70,9 @@ def initialize_tools():
         # Initialize all tools
         global sheets, extractor, tweet_storer, twitter, bsky, scheduler, llm
         sheets = GoogleSheetsClient(credentials_path, GOOGLE_SHEET_ID)
-        extractor = ExtractContent()
+        extractor = get_extractor()
         tweet_storer = StoreTweets(sheets)
-        twitter = MultiTwitterPlaywright()
+        twitter = get_twitter()
         bsky = BlueskyAPI()
         scheduler = SchedulePost(sheets)
         llm = LLMOrchestrator(provider="openai")
@@ -92,6 +92,13 @@ async def cleanup_resources():
         if hasattr(twitter, 'close_session'):
             await twitter.close_session()
             logger.info("Closed Twitter sessions on server cleanup")
+        
+        # Cleanup the shared Bluesky HTTP session
+        await close_bsky_session()
+        
+        # Cleanup the shared extractor's browser, page pool and Playwright driver
+        await get_extractor().cleanup()
+        logger.info("Closed content extractor browser on server cleanup")
             
         # Cleanup any other resources
         for session in active_sessions:
@@ -127,15 +134,16 @@ async def store_tweets(row_id: int, tweets: list) -> str:
 async def post_tweet(tweet: str) -> str:
     """Post a tweet using both Twitter accounts."""
     try:
-        # Post with primary account
-        primary_success = await twitter.post_tweet(tweet, 'primary')
+        # Post with both accounts at once
+        results = await twitter.post_tweet_all(tweet)
+        primary_success = results['primary']
+        secondary_success = results['secondary']
+        
         if primary_success:
             logger.info("Tweet posted successfully with primary account")
         else:
             logger.warning("Failed to post tweet with primary account")
         
-        # Post with secondary account
-        secondary_success = await twitter.post_tweet(tweet, 'secondary')
         if secondary_success:
             logger.info("Tweet posted successfully with secondary account")
         else:
@@ -172,21 +180,15 @@ async def engage_twitter(max_likes: int = 10) -> str:
         # Split likes between accounts
         likes_per_account = max_likes // 2
         
-        # Engage with primary account using primary search terms
+        # Engage with both accounts at once, each with its own search terms
         logger.info(f"Primary account using search term: {primary_search_term}")
-        primary_success = await twitter.search_and_like_tweets(
-            search_term=primary_search_term, 
-            max_likes=likes_per_account, 
-            account_name='primary'
-        )
-        
-        # Engage with secondary account using secondary search terms
         logger.info(f"Secondary account using search term: {secondary_search_term}")
-        secondary_success = await twitter.search_and_like_tweets(
-            search_term=secondary_search_term, 
-            max_likes=likes_per_account, 
-            account_name='secondary'
+        results = await twitter.search_and_like_all(
+            {'primary': primary_search_term, 'secondary': secondary_search_term},
+            max_likes=likes_per_account
         )
+        primary_success = results['primary']
+        secondary_success = results['secondary']
         
         if primary_success and secondary_success:
             return f"Successfully engaged with {max_likes} tweets using both accounts"
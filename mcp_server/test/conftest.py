@@ -0,0 +1,54 @@
+import os
+import socket
+import pytest
+import pytest_asyncio
+
+# Importing config loads .env once for the whole run
+from mcp_server.config import Settings
+
+# Browser modules are imported inside their fixtures so tests that only need
+# settings (Bluesky, Telegram) can be collected without playwright installed
+
+def _cdp_port() -> int:
+    """PLAYWRIGHT_CDP_PORT if set, else a free port so runs don't collide with a local debugger."""
+    port = os.getenv('PLAYWRIGHT_CDP_PORT')
+    if port:
+        return int(port)
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+@pytest.fixture(scope="session")
+def settings():
+    """Environment settings shared by every test in the run."""
+    return Settings.from_env()
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def twitter():
+    """Single-account Twitter session shared by every test in the run."""
+    from mcp_server.tools.post_tweets import BrowserPool, TwitterPlaywright
+    tw = TwitterPlaywright()
+    yield tw
+    await tw.close_session()
+    await BrowserPool.instance().close()
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def cdp_endpoint():
+    """Launch one Chromium for the run that browser helpers attach to over CDP."""
+    from playwright.async_api import async_playwright
+    port = _cdp_port()
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(
+            headless=True,
+            args=[f'--remote-debugging-port={port}', '--no-sandbox']
+        )
+        yield f"http://127.0.0.1:{port}"
+        await browser.close()
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def multi_twitter(cdp_endpoint):
+    """Multi-account Twitter session shared by every test in the run."""
+    from mcp_server.tools.multi_twitter import MultiTwitterPlaywright
+    tw = MultiTwitterPlaywright(cdp_endpoint=cdp_endpoint)
+    yield tw
+    await tw.close_session()
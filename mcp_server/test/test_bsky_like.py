@@ -23,17 +23,16 @@ async def test_bsky_like():
         logger.info(f"Loading .env from: {dotenv_path}")
         load_dotenv(dotenv_path)
         
-        # Initialize BlueskyAPI
-        bsky = BlueskyAPI()
-        logger.info("BlueskyAPI initialized")
-        
         # Test parameters
         like_count = 3  # Number of posts to like
         logger.info(f"Will attempt to like {like_count} blockchain posts")
         
-        # Attempt to search and like posts
-        logger.info("Starting blockchain post search and like...")
-        results = bsky.search_and_like_blockchain(like_count=like_count)
+        async with BlueskyAPI() as bsky:
+            logger.info("BlueskyAPI initialized")
+            
+            # Attempt to search and like posts
+            logger.info("Starting blockchain post search and like...")
+            results = await bsky.search_and_like_blockchain(search_term="#blockchain", like_count=like_count)
         
         # Log results
         logger.info(f"Successfully liked {len(results)} posts")
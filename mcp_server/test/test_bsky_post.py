@@ -23,18 +23,17 @@ async def test_bsky_post():
         logger.info(f"Loading .env from: {dotenv_path}")
         load_dotenv(dotenv_path)
         
-        # Initialize BlueskyAPI
-        bsky = BlueskyAPI()
-        logger.info("BlueskyAPI initialized")
-        
         # Test post content
         test_post = """🚨 Don't get REKT! Prioritizing security in #blockchain and #crypto is non-negotiable. Stay vigilant! #Web3SafetyTips #CryptoSecurityAlert"""
         
-        # Attempt to post
-        logger.info("Attempting to post to Bluesky...")
-        logger.info(f"Post content: {test_post}")
-        result = bsky.create_post(test_post)
-        logger.info(f"Post created successfully! Response: {result}")
+        async with BlueskyAPI() as bsky:
+            logger.info("BlueskyAPI initialized")
+            
+            # Attempt to post
+            logger.info("Attempting to post to Bluesky...")
+            logger.info(f"Post content: {test_post}")
+            result = await bsky.create_post(test_post)
+            logger.info(f"Post created successfully! Response: {result}")
         
     except Exception as e:
         logger.error(f"Test failed with error: {str(e)}")
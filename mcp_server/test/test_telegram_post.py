@@ -1,6 +1,6 @@
-import os
 import logging
-from dotenv import load_dotenv, find_dotenv
+import pytest
+from mcp_server.config import Settings
 from mcp_server.tools.telegram_post import TelegramPoster
 
 # Configure logging
@@ -10,46 +10,46 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Settings fields the test needs; an empty value counts as missing
+_REQUIRED_SETTINGS = frozenset({
+    'telegram_bot_token',
+    'telegram_channel',
+    'google_sheet_id',
+    'google_sheets_credentials'
+})
+
+def _missing_settings(settings: Settings) -> list:
+    return sorted(name.upper() for name in _REQUIRED_SETTINGS if not getattr(settings, name))
+
+@pytest.fixture(autouse=True)
+def _require_env(settings):
+    missing = _missing_settings(settings)
+    if missing:
+        pytest.skip(f"Missing required environment variables: {', '.join(missing)}")
+
+def test_telegram_post():
+    # Initialize TelegramPoster
+    logger.info("Initializing TelegramPoster...")
+    tg_poster = TelegramPoster()
+    
+    # Test getting pending URLs
+    logger.info("Testing get_pending_urls()...")
+    pending_urls = tg_poster.get_pending_urls()
+    logger.info(f"Found {len(pending_urls)} pending URLs")
+    
+    # Test processing and posting
+    logger.info("Starting to process and post URLs...")
+    tg_poster.process_and_post(limit=2)  # Process only 2 URLs for testing
+    
+    logger.info("Test completed successfully")
+
 def main():
-    try:
-        # Load environment variables
-        dotenv_path = find_dotenv()
-        if not dotenv_path:
-            logger.error("No .env file found")
-            return
-            
-        load_dotenv(dotenv_path)
-        logger.info(f"Loaded .env from: {dotenv_path}")
-        
-        # Check required environment variables
-        required_vars = [
-            'TELEGRAM_BOT_TOKEN',
-            'TELEGRAM_CHANNEL',
-            'GOOGLE_SHEET_ID',
-            'GOOGLE_SHEETS_CREDENTIALS'
-        ]
-        missing_vars = [var for var in required_vars if not os.getenv(var)]
-        if missing_vars:
-            logger.error(f"Missing required environment variables: {', '.join(missing_vars)}")
-            return
-            
-        # Initialize TelegramPoster
-        logger.info("Initializing TelegramPoster...")
-        tg_poster = TelegramPoster()
-        
-        # Test getting pending URLs
-        logger.info("Testing get_pending_urls()...")
-        pending_urls = tg_poster.get_pending_urls()
-        logger.info(f"Found {len(pending_urls)} pending URLs")
-        
-        # Test processing and posting
-        logger.info("Starting to process and post URLs...")
-        tg_poster.process_and_post(limit=2)  # Process only 2 URLs for testing
-        
-        logger.info("Test completed successfully")
-        
-    except Exception as e:
-        logger.error(f"Error in main: {str(e)}", exc_info=True)
+    settings = Settings.from_env()
+    missing = _missing_settings(settings)
+    if missing:
+        logger.error(f"Missing required environment variables: {', '.join(missing)}")
+        return
+    test_telegram_post()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -1,13 +1,9 @@
 import asyncio
 import logging
 import sys
-import os
-
-# Add the project root to Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+import pytest
 
 from mcp_server.tools.post_tweets import TwitterPlaywright
-from dotenv import load_dotenv, find_dotenv
 
 # Configure logging to show detailed information
 logging.basicConfig(
@@ -16,35 +12,36 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-async def test_twitter_login():
-    twitter = None
+@pytest.mark.asyncio(loop_scope="session")
+async def test_twitter_login(twitter):
     try:
-        # Load environment variables
-        dotenv_path = find_dotenv()
-        logger.info(f"Loading .env from: {dotenv_path}")
-        load_dotenv(dotenv_path)
-        
-        # Initialize TwitterPlaywright
-        twitter = TwitterPlaywright()
-        logger.info("TwitterPlaywright initialized")
-        
         # Test tweet content
         test_tweet = """🕵️‍♂️🖼️ #Blockchain providing irrefutable proof of ownership and provenance for AI-generated #NFTs. No more questioning the artist... even if it's a bot. #AIArtNFT #NFTAuthenticity #CryptoArt"""
         
-        # Attempt to post tweet
-        logger.info("Attempting to post tweet...")
-        logger.info(f"Tweet content: {test_tweet}")
-        post_success = await twitter.post_tweet(test_tweet)
-        if post_success:
-            logger.info("Tweet posted successfully!")
-        else:
-            logger.warning("Tweet posting failed, but continuing with search and like...")
-        
-        # Test search and like functionality
-        logger.info("Testing search and like functionality...")
         search_term = "#blockchain"
         max_likes = 3
-        search_success = await twitter.search_and_like_tweets(search_term, max_likes)
+        
+        # Log in once up front; the second session below restores the storage state this saves
+        await twitter.ensure_logged_in()
+        
+        # Post and search/like are independent, so run them on separate sessions in the shared browser
+        searcher = TwitterPlaywright()
+        try:
+            logger.info("Posting tweet and searching/liking concurrently...")
+            logger.info(f"Tweet content: {test_tweet}")
+            post_task = asyncio.create_task(twitter.post_tweet(test_tweet))
+            search_task = asyncio.create_task(searcher.search_and_like_tweets(search_term, max_likes))
+            post_success, search_success = await asyncio.gather(post_task, search_task, return_exceptions=True)
+        finally:
+            await searcher.close_session()
+        
+        if isinstance(post_success, Exception) or not post_success:
+            logger.warning(f"Tweet posting failed: {post_success}")
+        else:
+            logger.info("Tweet posted successfully!")
+        
+        if isinstance(search_success, Exception):
+            raise search_success
         if not search_success:
             raise Exception("Failed to search and like tweets")
         logger.info("Search and like test completed!")
@@ -52,19 +49,25 @@ async def test_twitter_login():
     except Exception as e:
         logger.error(f"Test failed with error: {str(e)}")
         raise
+
+async def main():
+    # Initialize TwitterPlaywright
+    twitter = TwitterPlaywright()
+    logger.info("TwitterPlaywright initialized")
+    try:
+        await test_twitter_login(twitter)
     finally:
-        if twitter:
-            try:
-                await twitter.close_session()
-            except:
-                pass
+        try:
+            await twitter.close_session()
+        except:
+            pass
 
 if __name__ == "__main__":
     try:
         # Run the test
-        asyncio.run(test_twitter_login())
+        asyncio.run(main())
     except KeyboardInterrupt:
         logger.info("Test interrupted by user")
     except Exception as e:
         logger.error(f"Test failed: {str(e)}")
-        sys.exit(1)  # Exit with error code 
\ No newline at end of file
+        sys.exit(1)  # Exit with error code
@@ -1,60 +1,306 @@
 # Placeholder for posting to Bluesky via API
 
 import os
+import base64
 import aiohttp
 import asyncio
+import itertools
 from typing import Optional, List, Dict
 import logging
 import time
-from datetime import datetime, timezone
+from functools import lru_cache
+from urllib.parse import quote, urlencode
+from yarl import URL
 from common.google_sheets import GoogleSheetsClient
-import json
+from common.retry_utils import retry_on_http_error, WRITE_RETRYABLE_STATUSES
+import orjson
+import grapheme
+from aiolimiter import AsyncLimiter
 
 logger = logging.getLogger(__name__)
 
+def _now_iso() -> str:
+    """Current UTC time as the millisecond ISO-8601 string Bluesky expects for createdAt."""
+    t = time.time()
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(t))}.{int(t % 1 * 1000):03d}Z"
+
+# Request bodies are pre-encoded with orjson, so the content type is set by hand
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Static JSON around the variable fields of createRecord bodies; only repo,
+# text/subject and createdAt are encoded per call
+_POST_PREFIX = b'{"repo":'
+_POST_TEXT = b',"collection":"app.bsky.feed.post","record":{"$type":"app.bsky.feed.post","text":'
+_POST_SUFFIX = b',"langs":["en"]}}'
+_LIKE_SUBJECT = b',"collection":"app.bsky.feed.like","record":{"$type":"app.bsky.feed.like","subject":'
+_CREATED_AT = b',"createdAt":'
+
+def _post_body(repo: str, text: str, created_at: str) -> bytes:
+    """Encode an app.bsky.feed.post createRecord body."""
+    return b''.join((_POST_PREFIX, orjson.dumps(repo), _POST_TEXT, orjson.dumps(text),
+                     _CREATED_AT, orjson.dumps(created_at), _POST_SUFFIX))
+
+def _like_body(repo: str, uri: str, cid: str, created_at: str) -> bytes:
+    """Encode an app.bsky.feed.like createRecord body."""
+    return b''.join((_POST_PREFIX, orjson.dumps(repo), _LIKE_SUBJECT, orjson.dumps({'uri': uri, 'cid': cid}),
+                     _CREATED_AT, orjson.dumps(created_at), b'}}'))
+
+# Bluesky rejects post text longer than this many graphemes with a 400
+MAX_POST_GRAPHEMES = 300
+
+# C0 control characters cleaned before posting: whitespace controls other than
+# newline become a space so words stay apart, the rest are removed
+_CTRL_TABLE = {c: (' ' if chr(c) in '\t\r\x0b\x0c\x1c\x1d\x1e\x1f' else None)
+               for c in range(32) if c != ord('\n')}
+
+def _prepare_post_text(text: str) -> str:
+    """Strip control characters and truncate text to Bluesky's grapheme limit."""
+    if '\r' in text:
+        text = text.replace('\r\n', '\n')
+    text = text.translate(_CTRL_TABLE)
+    # Code points never undercount graphemes, so short texts skip the grapheme scan
+    if len(text) > MAX_POST_GRAPHEMES and grapheme.length(text) > MAX_POST_GRAPHEMES:
+        text = grapheme.slice(text, 0, MAX_POST_GRAPHEMES - 3) + '...'
+    return text
+
+# Responses larger than this are decoded in a worker thread to keep the event loop free
+_THREAD_PARSE_BYTES = 32 * 1024
+
+# Upper bound on posts in flight at once from a single post_from_sheets call
+POST_CONCURRENCY = 5
+
+# Upper bound on like/check requests in flight at once from search_and_like_blockchain
+LIKE_CONCURRENCY = 4
+
+# One pooled HTTP session, write rate limiter and auth lock per event loop, shared by
+# every BlueskyAPI instance so all writes count against Bluesky's rate limit. All are
+# bound to the loop that created them, so a new loop (another asyncio.run, a
+# fresh pytest loop) gets its own.
+_SESSION: Optional[aiohttp.ClientSession] = None
+_RATE: Optional[AsyncLimiter] = None
+_AUTH_LOCK: Optional[asyncio.Lock] = None
+_SESSION_USERS = 0  # BlueskyAPI instances holding _SESSION
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+def _bind_loop():
+    """Drop the shared loop-bound objects if they belong to another event loop."""
+    global _SESSION, _SESSION_USERS, _RATE, _AUTH_LOCK, _LOOP
+    loop = asyncio.get_running_loop()
+    if _LOOP is not loop:
+        # A session from an earlier loop cannot be closed from this one
+        _SESSION = None
+        _SESSION_USERS = 0
+        _RATE = AsyncLimiter(30, 60)
+        _AUTH_LOCK = asyncio.Lock()
+        _LOOP = loop
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the running loop's shared HTTP session, creating it on first use."""
+    global _SESSION, _SESSION_USERS
+    _bind_loop()
+    if _SESSION is None or _SESSION.closed:
+        _SESSION_USERS = 0
+        connector = aiohttp.TCPConnector(limit=100, limit_per_host=32, keepalive_timeout=75, ttl_dns_cache=300)
+        _SESSION = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=30))
+    return _SESSION
+
+def _rate_limiter() -> AsyncLimiter:
+    """Return the running loop's shared write rate limiter."""
+    _bind_loop()
+    return _RATE
+
+def _auth_lock() -> asyncio.Lock:
+    """Return the running loop's lock serializing token refreshes."""
+    _bind_loop()
+    return _AUTH_LOCK
+
+# identifier -> {'access', 'refresh', 'exp'}; tokens are reused until shortly before expiry
+_TOKENS: Dict[str, Dict] = {}
+_EXPIRY_MARGIN = 60
+
+def _jwt_exp(token: str) -> float:
+    """Return the exp claim of a JWT, or 0 if it cannot be read."""
+    try:
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        return float(orjson.loads(base64.urlsafe_b64decode(payload)).get('exp', 0))
+    except (IndexError, ValueError, AttributeError):
+        return 0.0
+
+async def close_session():
+    """Close the running loop's shared HTTP session; call once on shutdown."""
+    global _SESSION, _SESSION_USERS
+    _bind_loop()
+    if _SESSION is not None and not _SESSION.closed:
+        await _SESSION.close()
+    _SESSION = None
+    _SESSION_USERS = 0
+
+async def _release_session(session: aiohttp.ClientSession):
+    """Drop one instance's hold on the shared session, closing it after the last one."""
+    global _SESSION_USERS
+    if session is not _SESSION:
+        return  # already replaced or closed
+    _SESSION_USERS -= 1
+    if _SESSION_USERS <= 0:
+        await close_session()
+
+@lru_cache(maxsize=1024)
+def _parse_tweet_texts(tweets_json: str) -> tuple:
+    """Parse a sheet row's "tweets" cell into a tuple of non-empty post texts.
+
+    Cached on the raw cell value, so rows that have not changed since the
+    previous call are not parsed again.
+    """
+    tweets = orjson.loads(tweets_json)
+    if isinstance(tweets, dict):
+        tweets = (tweets,)
+    elif not isinstance(tweets, list):
+        return ()
+    texts = []
+    append = texts.append
+    for tweet in tweets:
+        # Skip malformed entries rather than dropping the whole row
+        text = tweet.get('text') if isinstance(tweet, dict) else None
+        if isinstance(text, str):
+            text = text.strip()
+            if text:
+                append(text)
+    return tuple(texts)
+
+@lru_cache(maxsize=64)
+def _search_url_prefix(search_term: str) -> str:
+    """searchPosts URL with the term already encoded, ending at the limit value."""
+    return f"https://bsky.social/xrpc/app.bsky.feed.searchPosts?{urlencode({'q': search_term}, quote_via=quote)}&limit="
+
+@lru_cache(maxsize=1)
+def _get_sheets_client(credentials_path: str, sheet_id: str) -> GoogleSheetsClient:
+    """Build the Sheets client once; later calls reuse its authorized session."""
+    return GoogleSheetsClient(credentials_path, sheet_id)
+
+def _iter_tweet_texts(rows):
+    """Yield post texts from the "tweets" column of each sheet row, in order."""
+    for row in rows:
+        tweets_json = row.get('tweets')
+        if not tweets_json:
+            logger.warning("No tweets found in row, skipping")
+            continue
+        if not isinstance(tweets_json, str):
+            tweets_json = str(tweets_json)
+        try:
+            yield from _parse_tweet_texts(tweets_json)
+        except orjson.JSONDecodeError:
+            logger.warning("Invalid tweets JSON, skipping")
+
 class BlueskyAPI:
     def __init__(self):
         self.api_key = os.getenv('BLUESKY_API_KEY')
         self.api_password = os.getenv('BLUESKY_API_PASSWORD')
         self.session = None
         self.access_jwt = None
+        self._search_cursors = {}  # search term -> cursor to resume from
+        self._liked_uris = set()
         logger.info("BlueskyAPI initialized")
 
+    async def __aenter__(self):
+        await self._ensure_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Release this instance's hold on the shared HTTP session.
+
+        The session is closed once no open instance holds it; instances that
+        are never closed keep it alive until close_session() at shutdown.
+        """
+        session, self.session = self.session, None
+        if session is not None:
+            await _release_session(session)
+
+    async def _hold_session(self):
+        """Point self.session at the shared session, counting this instance as a user."""
+        global _SESSION_USERS
+        session = await get_session()
+        if self.session is not session:
+            _SESSION_USERS += 1
+            self.session = session
+
+    @property
+    def _auth_headers(self) -> Dict[str, str]:
+        """Authorization header for this account; the shared session carries none."""
+        return {'Authorization': f'Bearer {self.access_jwt}'}
+
+    def _cached_token(self) -> Optional[Dict]:
+        """Return this account's cached tokens if the access JWT is not about to expire."""
+        cached = _TOKENS.get(self.api_key)
+        if cached and time.time() < cached['exp'] - _EXPIRY_MARGIN:
+            return cached
+        return None
+
+    def _store_tokens(self, data: dict):
+        """Cache the tokens returned by createSession/refreshSession."""
+        self.access_jwt = data.get('accessJwt')
+        _TOKENS[self.api_key] = {
+            'access': self.access_jwt,
+            'refresh': data.get('refreshJwt'),
+            'exp': _jwt_exp(self.access_jwt or '')
+        }
+
+    def _invalidate_token(self):
+        """Force the next _ensure_session to refresh the access JWT."""
+        cached = _TOKENS.get(self.api_key)
+        if cached and cached['access'] == self.access_jwt:
+            cached['exp'] = 0.0
+
     async def _ensure_session(self):
-        """Ensure we have a valid session, refresh if needed."""
+        """Ensure we have a valid access token, refreshing it only near expiry."""
         try:
-            if not self.session:
-                self.session = aiohttp.ClientSession()
+            await self._hold_session()
             
-            # Check if session is valid by making a test request
-            try:
-                test_url = 'https://bsky.social/xrpc/com.atproto.server.getSession'
-                async with self.session.get(test_url) as resp:
-                    if resp.status == 401 or resp.status == 403:
-                        logger.warning("Session expired, refreshing...")
-                        await self._refresh_session()
-                    elif resp.status != 200:
-                        logger.warning(f"Session check failed with status {resp.status}, refreshing...")
-                        await self._refresh_session()
-            except Exception as e:
-                logger.warning(f"Session check failed: {str(e)}, refreshing...")
+            cached = self._cached_token()
+            if cached:
+                self.access_jwt = cached['access']
+                return
+            
+            # Concurrent callers wait here for a single refresh instead of each logging in
+            async with _auth_lock():
+                cached = self._cached_token()
+                if cached:
+                    self.access_jwt = cached['access']
+                    return
+                
+                stale = _TOKENS.get(self.api_key)
+                if stale and stale.get('refresh'):
+                    try:
+                        await self._refresh_jwt(stale['refresh'])
+                        return
+                    except Exception as e:
+                        logger.warning(f"Token refresh failed: {str(e)}, logging in again...")
                 await self._refresh_session()
                 
         except Exception as e:
             logger.error(f"Error ensuring session: {str(e)}")
             raise
 
+    async def _refresh_jwt(self, refresh_jwt: str):
+        """Exchange a refresh JWT for a new access token via refreshSession."""
+        url = 'https://bsky.social/xrpc/com.atproto.server.refreshSession'
+        async with self.session.post(url, headers={'Authorization': f'Bearer {refresh_jwt}'}) as resp:
+            resp.raise_for_status()
+            raw = await resp.read()
+        self._store_tokens(orjson.loads(raw))
+        logger.info("Refreshed Bluesky access token")
+
+    @retry_on_http_error()
     async def _refresh_session(self):
-        """Refresh the Bluesky session."""
+        """Log in with the account password and cache the new tokens."""
         try:
             logger.info("Refreshing Bluesky session...")
             
-            # Close existing session if any
-            if self.session:
-                await self.session.close()
-            
-            # Create new session
-            self.session = aiohttp.ClientSession()
+            # Reuse the shared session so its pooled connections are kept
+            await self._hold_session()
             
             # Re-authenticate
             url = 'https://bsky.social/xrpc/com.atproto.server.createSession'
@@ -63,25 +309,45 @@ class BlueskyAPI:
                 "password": self.api_password
             }
             
-            async with self.session.post(url, json=payload) as resp:
-                if resp.status != 200:
-                    error_text = await resp.text()
-                    raise Exception(f"Authentication failed: {error_text}")
-                
-                data = await resp.json()
-                self.access_jwt = data.get('accessJwt')
-                
-                # Update session headers
-                self.session.headers.update({
-                    'Authorization': f'Bearer {self.access_jwt}'
-                })
-                
+            async with self.session.post(url, data=orjson.dumps(payload), headers=_JSON_HEADERS) as resp:
+                if not resp.ok:
+                    logger.error(f"Authentication failed: {await resp.text()}")
+                    # ClientResponseError keeps the status for retry_on_http_error
+                    resp.raise_for_status()
+                raw = await resp.read()
+            
+            # Release the connection before parsing and storing the tokens
+            self._store_tokens(orjson.loads(raw))
             logger.info("Successfully refreshed Bluesky session")
             
         except Exception as e:
             logger.error(f"Error refreshing session: {str(e)}")
             raise
 
+    async def _post_record(self, url: str, body: bytes) -> dict:
+        """POST a JSON body to an XRPC endpoint, re-authenticating once if the token is rejected."""
+        for attempt in range(2):
+            headers = {**_JSON_HEADERS, **self._auth_headers}
+            async with _rate_limiter(), self.session.post(url, data=body, headers=headers) as resp:
+                if resp.status == 401 and attempt == 0:
+                    logger.warning("Bluesky token rejected, re-authenticating...")
+                    self._invalidate_token()
+                    await self._ensure_session()
+                    continue
+                resp.raise_for_status()
+                return orjson.loads(await resp.read())
+
+    @retry_on_http_error()
+    async def _get_json(self, url, params: Optional[dict] = None) -> dict:
+        """GET an XRPC endpoint and return the decoded JSON body."""
+        async with self.session.get(url, params=params, headers=self._auth_headers) as resp:
+            resp.raise_for_status()
+            raw = await resp.read()
+        if len(raw) > _THREAD_PARSE_BYTES:
+            return await asyncio.to_thread(orjson.loads, raw)
+        return orjson.loads(raw)
+
+    @retry_on_http_error(statuses=WRITE_RETRYABLE_STATUSES)
     async def create_post(self, text: str, repo: Optional[str] = None) -> dict:
         """Create a post on Bluesky.
         
@@ -93,31 +359,23 @@ class BlueskyAPI:
             dict: The API response containing the created post's URI and CID
         """
         try:
+            # Fix up text Bluesky would reject before spending a request on it
+            text = _prepare_post_text(text)
             await self._ensure_session()
             url = 'https://bsky.social/xrpc/com.atproto.repo.createRecord'
             if repo is None:
                 repo = self.api_key  # This should be the DID (Decentralized Identifier)
                 
             # Get current timestamp in the correct format for Bluesky
-            created_at = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+            created_at = _now_iso()
             
-            payload = {
-                "repo": repo,
-                "collection": "app.bsky.feed.post",
-                "record": {
-                    "$type": "app.bsky.feed.post",
-                    "text": text,
-                    "createdAt": created_at,
-                    "langs": ["en"]
-                }
-            }
+            body = _post_body(repo, text, created_at)
             
-            logger.info(f"Creating Bluesky post with text: {text[:50]}...")
-            async with self.session.post(url, json=payload) as resp:
-                resp.raise_for_status()
-                result = await resp.json()
-                logger.info("Successfully created Bluesky post")
-                return result
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Creating Bluesky post with text: %s...", text[:50])
+            result = await self._post_record(url, body)
+            logger.debug("Successfully created Bluesky post")
+            return result
         except aiohttp.ClientResponseError as e:
             if e.status == 400:
                 logger.error(f"Bad request. Response: {await e.response.text()}")
@@ -126,15 +384,36 @@ class BlueskyAPI:
             logger.error(f"Error creating Bluesky post: {str(e)}")
             raise
 
+    async def _post_one(self, text: str) -> Dict:
+        """Post a single tweet from the sheet and report the outcome."""
+        try:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Posting tweet: %s...", text[:50])
+            result = await self.create_post(text)
+            logger.debug("Successfully posted tweet")
+            return {
+                'text': text,
+                'status': 'success',
+                'result': result
+            }
+        except Exception as e:
+            logger.error(f"Error posting tweets: {str(e)}")
+            return {
+                'text': text,
+                'status': 'error',
+                'error': str(e)
+            }
+
     async def post_from_sheets(self, sheet_name: str = "Sheet1", max_posts: int = 1) -> List[Dict]:
         """Post content from Google Sheets to Bluesky.
         
         Args:
             sheet_name (str): Name of the sheet containing content (default: "Sheet1")
-            max_posts (int): Maximum number of posts to make
+            max_posts (int): Number of successful posts to make; rows keep being
+                read past failed posts until this many succeed or the sheet runs out
             
         Returns:
-            List[Dict]: Results of the posting operations
+            List[Dict]: Results of the posting operations, failures included
         """
         try:
             # Initialize Google Sheets client
@@ -142,83 +421,56 @@ class BlueskyAPI:
             sheet_id = os.getenv('GOOGLE_SHEET_ID')
             if not sheet_id:
                 raise ValueError("GOOGLE_SHEET_ID environment variable is not set")
-            sheets = GoogleSheetsClient(credentials_path, sheet_id)
+            sheets = _get_sheets_client(credentials_path, sheet_id)
             
             logger.info(f"Fetching tweets from sheet: {sheet_name}")
-            rows = sheets.get_rows()
+            # Size pages to the request so posting one tweet fetches a few rows, not 200
+            rows = sheets.iter_rows(page_size=max(max_posts * 4, 20))
             
-            if not rows:
-                logger.warning("No rows found in sheet")
-                return []
+            texts = _iter_tweet_texts(rows)
+            
+            # Post concurrently, at most POST_CONCURRENCY at a time; the rate limiter paces
+            # the requests inside create_post. Results keep the sheet order.
+            sem = asyncio.Semaphore(POST_CONCURRENCY)
+            
+            async def _bounded(text: str) -> Dict:
+                async with sem:
+                    return await self._post_one(text)
             
+            # Each round takes only as many texts as posts still missing, so rows are
+            # read lazily and failed posts are replaced from the following rows
             results = []
             posts_made = 0
-            
-            for row in rows:
-                if posts_made >= max_posts:
+            while posts_made < max_posts:
+                batch = list(itertools.islice(texts, max_posts - posts_made))
+                if not batch:
                     break
-                    
-                try:
-                    # Get tweets from the "tweets" column
-                    tweets_json = row.get('tweets', '[]')
-                    if not tweets_json:
-                        logger.warning("No tweets found in row, skipping")
-                        continue
-                        
-                    # Parse tweets JSON
-                    try:
-                        tweets = json.loads(tweets_json)
-                        if not isinstance(tweets, list):
-                            tweets = [tweets]
-                    except json.JSONDecodeError:
-                        logger.warning("Invalid tweets JSON, skipping")
-                        continue
-                    
-                    # Post each tweet
-                    for tweet in tweets:
-                        if posts_made >= max_posts:
-                            break
-                            
-                        text = tweet.get('text', '').strip()
-                        if not text:
-                            logger.warning("Empty tweet text found, skipping")
-                            continue
-                            
-                        logger.info(f"Posting tweet: {text[:50]}...")
-                        result = await self.create_post(text)
-                        results.append({
-                            'text': text,
-                            'status': 'success',
-                            'result': result
-                        })
-                        posts_made += 1
-                        logger.info(f"Successfully posted tweet {posts_made}/{max_posts}")
-                        
-                        # Add delay between posts
-                        await asyncio.sleep(2)
-                    
-                except Exception as e:
-                    logger.error(f"Error posting tweets: {str(e)}")
-                    results.append({
-                        'text': text if 'text' in locals() else 'unknown',
-                        'status': 'error',
-                        'error': str(e)
-                    })
-                    continue
+                batch_results = await asyncio.gather(*(_bounded(text) for text in batch))
+                results.extend(batch_results)
+                posts_made += sum(1 for r in batch_results if r['status'] == 'success')
+            
+            if not results:
+                logger.warning("No tweets found in sheet")
+                return []
             
-            logger.info(f"Completed posting {len(results)} items to Bluesky")
+            logger.info(f"Completed posting {len(results)} items to Bluesky ({posts_made} succeeded)")
             return results
             
         except Exception as e:
             logger.error(f"Error in post_from_sheets: {str(e)}")
             raise
 
-    async def search_blockchain_posts(self, search_term: str, limit: int = 5) -> list:
+    async def search_blockchain_posts(self, search_term: str, limit: int = 5, overfetch: int = 5) -> list:
         """Search for posts using the given search term.
         
+        Results are paged: the cursor returned by each search is remembered per
+        search term, so the next call continues where this one stopped.
+        
         Args:
             search_term (str): The search term to use
-            limit (int): Maximum number of posts to return (default: 5)
+            limit (int): Number of posts wanted (default: 5)
+            overfetch (int): Multiplier applied to limit so callers can skip
+                unusable posts without another request (default: 5, capped at 100 posts)
             
         Returns:
             list: List of posts matching the search criteria
@@ -228,27 +480,34 @@ class BlueskyAPI:
             
             # Try the provided search term first
             try:
-                url = 'https://bsky.social/xrpc/app.bsky.feed.searchPosts'
-                params = {
-                    'q': search_term,
-                    'limit': limit
-                }
+                fetch_limit = min(limit * overfetch, 100)
+                query = _search_url_prefix(search_term) + str(fetch_limit)
+                cursor = self._search_cursors.get(search_term)
+                if cursor:
+                    query += '&cursor=' + quote(cursor, safe='')
+                url = URL(query, encoded=True)
                 
-                logger.info(f"Searching Bluesky for posts with term: {search_term} (limit: {limit})")
-                async with self.session.get(url, params=params) as resp:
-                    if resp.status == 400:
+                logger.debug("Searching Bluesky for posts with term: %s (limit: %s)", search_term, fetch_limit)
+                try:
+                    data = await self._get_json(url)
+                except aiohttp.ClientResponseError as e:
+                    if e.status == 400:
                         logger.warning(f"Bluesky search failed for term '{search_term}' with status 400")
                         return []
-                        
-                    resp.raise_for_status()
-                    data = await resp.json()
-                    posts = data.get('posts', [])
-                    
-                    if posts:
-                        logger.info(f"Found {len(posts)} posts on Bluesky with term '{search_term}'")
-                        return posts
-                    else:
-                        logger.warning(f"No posts found on Bluesky with term '{search_term}'")
+                    raise
+                posts = data.get('posts', [])
+                
+                # Start over from the newest posts once the results run out
+                if data.get('cursor'):
+                    self._search_cursors[search_term] = data['cursor']
+                else:
+                    self._search_cursors.pop(search_term, None)
+                
+                if posts:
+                    logger.debug("Found %d posts on Bluesky with term '%s'", len(posts), search_term)
+                    return posts
+                else:
+                    logger.warning(f"No posts found on Bluesky with term '{search_term}'")
             except Exception as e:
                 logger.warning(f"Error searching Bluesky with term '{search_term}': {str(e)}")
                 return []
@@ -259,6 +518,7 @@ class BlueskyAPI:
             logger.error(f"Error in search_blockchain_posts: {str(e)}")
             return []
 
+    @retry_on_http_error(statuses=WRITE_RETRYABLE_STATUSES)
     async def like_post(self, uri: str, cid: str, repo: Optional[str] = None) -> dict:
         """Like a post on Bluesky.
         
@@ -276,27 +536,14 @@ class BlueskyAPI:
             if repo is None:
                 repo = self.api_key
                 
-            created_at = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+            created_at = _now_iso()
             
-            payload = {
-                "repo": repo,
-                "collection": "app.bsky.feed.like",
-                "record": {
-                    "$type": "app.bsky.feed.like",
-                    "subject": {
-                        "uri": uri,
-                        "cid": cid
-                    },
-                    "createdAt": created_at
-                }
-            }
+            body = _like_body(repo, uri, cid, created_at)
             
-            logger.info(f"Liking post: {uri}")
-            async with self.session.post(url, json=payload) as resp:
-                resp.raise_for_status()
-                result = await resp.json()
-                logger.info("Successfully liked post")
-                return result
+            logger.debug("Liking post: %s", uri)
+            result = await self._post_record(url, body)
+            logger.debug("Successfully liked post")
+            return result
             
         except aiohttp.ClientResponseError as e:
             if e.status == 400:
@@ -324,30 +571,41 @@ class BlueskyAPI:
                 logger.warning(f"No posts found to like on Bluesky with term '{search_term}'")
                 return []
             
-            results = []
+            candidates = []
             for i, post in enumerate(posts, 1):
-                try:
-                    uri = post.get('uri')
-                    cid = post.get('cid')
-                    if not uri or not cid:
-                        logger.warning(f"Post {i} missing URI or CID, skipping")
-                        continue
-                    
-                    # Check if we've already liked this post
-                    if await self._check_if_liked(uri):
-                        logger.info(f"Post {i} already liked, skipping")
-                        continue
-                        
-                    logger.info(f"Liking Bluesky post {i}/{len(posts)}: {uri}")
-                    result = await self.like_post(uri, cid)
-                    results.append(result)
-                    logger.info(f"Successfully liked Bluesky post {i}")
-                    
-                    await asyncio.sleep(1)
-                    
-                except Exception as e:
-                    logger.error(f"Failed to like Bluesky post {i}: {str(e)}")
-                    continue
+                if not post.get('uri') or not post.get('cid'):
+                    logger.warning(f"Post {i} missing URI or CID, skipping")
+                elif post['uri'] in self._liked_uris:
+                    logger.debug("Post %d already liked, skipping", i)
+                else:
+                    candidates.append(post)
+            
+            sem = asyncio.Semaphore(LIKE_CONCURRENCY)
+            
+            async def _like_one(post: dict) -> Optional[dict]:
+                uri = post['uri']
+                async with sem:
+                    try:
+                        if await self._check_if_liked(uri):
+                            self._liked_uris.add(uri)
+                            logger.debug("Post %s already liked, skipping", uri)
+                            return None
+                        result = await self.like_post(uri, post['cid'])
+                        self._liked_uris.add(uri)
+                        logger.debug("Successfully liked Bluesky post %s", uri)
+                        return result
+                    except Exception as e:
+                        logger.error(f"Failed to like Bluesky post {uri}: {str(e)}")
+                        return None
+            
+            # Like in waves sized to the likes still needed, so skipped or
+            # failed posts are replaced without ever overshooting like_count
+            results = []
+            while candidates and len(results) < like_count:
+                wave = candidates[:like_count - len(results)]
+                candidates = candidates[len(wave):]
+                liked = await asyncio.gather(*(_like_one(post) for post in wave))
+                results.extend(result for result in liked if result is not None)
             
             logger.info(f"Completed Bluesky engagement: liked {len(results)} posts with term '{search_term}'")
             return results
@@ -363,32 +621,9 @@ class BlueskyAPI:
             url = 'https://bsky.social/xrpc/app.bsky.feed.getLikes'
             params = {'uri': uri}
             
-            async with self.session.get(url, params=params) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    likes = data.get('likes', [])
-                    return any(like.get('actor', {}).get('did') == self.api_key for like in likes)
-                return False
+            data = await self._get_json(url, params)
+            likes = data.get('likes', [])
+            return any(like.get('actor', {}).get('did') == self.api_key for like in likes)
         except Exception as e:
             logger.warning(f"Error checking if post was liked: {str(e)}")
             return False
-
-    def post(self, text: str) -> bool:
-        """Post a text to Bluesky."""
-        try:
-            url = f"{self.base_url}/com.atproto.repo.createRecord"
-            payload = {
-                "repo": self.did,
-                "collection": "app.bsky.feed.post",
-                "record": {
-                    "text": text,
-                    "createdAt": datetime.now().isoformat(),
-                    "$type": "app.bsky.feed.post"
-                }
-            }
-            resp = self.session.post(url, json=payload)
-            resp.raise_for_status()
-            return True
-        except Exception as e:
-            logger.error(f"Error posting to Bluesky: {str(e)}")
-            return False
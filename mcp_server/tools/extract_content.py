@@ -1,24 +1,155 @@
 import asyncio
+import aiohttp
 import logging
 import time
 import random
+from functools import lru_cache
 from urllib.parse import urlparse
 from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright, TimeoutError
-from fake_useragent import UserAgent
+import soupsieve
+from typing import TYPE_CHECKING
+
+# playwright and fake_useragent are imported on first use: most static pages
+# are served by the HTTP fast path and never need them
+if TYPE_CHECKING:
+    from fake_useragent import UserAgent
 
 logger = logging.getLogger(__name__)
 
+# Sheet status values that sometimes end up in the url column
+_STATUS_STRINGS = frozenset({'pending', 'in_progress', 'complete', 'error'})
+_HTTP_SCHEMES = ('http://', 'https://')
+
+# Boilerplate stripped from a content element before taking its text
+_UNWANTED = 'script, style, .ads, .advertisement, .social-share, .comments, .related-posts, .newsletter, .sidebar, .widget, .share-buttons, .author-bio, .recommended-posts'
+# Site navigation and boilerplate, stripped when falling back to the whole body
+_PAGE_CHROME = 'nav, footer, header, .nav, .footer, .header, ' + _UNWANTED
+
+# Content selectors per domain, tried in order
+_SITE_SELECTORS = {
+    'cointelegraph.com': [
+        '.post__content',
+        '.post__content-wrapper',
+        'article',
+        '.article__content',
+        '[itemprop="articleBody"]',
+        '.post-content',
+        '.article-text'
+    ],
+    'crypto.news': [
+        '.article-content',
+        '.post-content',
+        'article',
+        '.entry-content',
+        '[itemprop="articleBody"]',
+        '.content-area'
+    ],
+    'analytickit.com': [
+        '.post-content',
+        '.entry-content',
+        'article',
+        '.article-content',
+        '[itemprop="articleBody"]',
+        '.content'
+    ],
+    'default': [
+        'article',
+        '.article',
+        '.post-content',
+        '.entry-content',
+        'main',
+        '.content',
+        '#content',
+        '.post',
+        '.article-content',
+        '.story-content',
+        '.article-body',
+        '.post-body',
+        '.entry',
+        '.blog-post',
+        '.news-content',
+        '[itemprop="articleBody"]',
+        '.article-text',
+        '.article-body-text',
+        '.article-content-text'
+    ]
+}
+
+# Selectors are compiled once instead of being re-parsed for every element and URL
+_UNWANTED_SEL = soupsieve.compile(_UNWANTED)
+_PAGE_CHROME_SEL = soupsieve.compile(_PAGE_CHROME)
+# Main content area fallbacks, tried in this priority order rather than document order
+_MAIN_SELS = tuple(soupsieve.compile(selector) for selector in ('main', '#main', '.main'))
+
+@lru_cache(maxsize=128)
+def _compile_selector(selector: str) -> soupsieve.SoupSieve:
+    """Compiled form of a content selector."""
+    return soupsieve.compile(selector)
+
+# Sites that render their article text client-side; these always go through the browser
+JS_REQUIRED_DOMAINS = frozenset({'x.com', 'twitter.com'})
+
+# Pages are recycled after this many extractions to keep renderer memory bounded
+PAGE_MAX_USES = 50
+
+# Cookies collected from visited sites are dropped every this many extractions
+CLEAR_COOKIES_EVERY = 100
+
+# True once the first content element holds a full article's worth of text;
+# textContent avoids the forced layout of innerText
+_CONTENT_READY_JS = "sel => { const el = document.querySelector(sel); return !!el && el.textContent.length > 500; }"
+
+# Article text never needs these, so they are not downloaded
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+
+_EXTRA_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0',
+    'DNT': '1'
+}
+
+@lru_cache(maxsize=1)
+def _user_agent() -> 'UserAgent':
+    """Load the fake_useragent database once per process."""
+    from fake_useragent import UserAgent
+    return UserAgent()
+
 class ExtractContent:
-    def __init__(self):
-        self.ua = UserAgent()
+    def __init__(self, pool_size: int = 4):
         self.browser = None
         self.context = None
         self.playwright = None
+        self.pool_size = pool_size
+        self._page_pool = None  # asyncio.Queue of reusable pages, filled by init_browser
+        self._page_uses = {}  # page -> extractions since it was created
+        self._extract_count = 0
+        self._http = None  # aiohttp session for the plain-HTTP fast path
+        # Serialises browser startup and teardown; the shared instance sees concurrent extract() calls
+        self._browser_lock = asyncio.Lock()
+
+    @property
+    def ua(self) -> 'UserAgent':
+        return _user_agent()
 
     async def init_browser(self):
-        """Initialize the browser if not already initialized."""
-        if not self.browser:
+        """Initialize the browser if not already initialized.
+        
+        The page pool is assigned last, so a non-None pool means startup finished.
+        """
+        if self._page_pool is not None:
+            return
+        async with self._browser_lock:
+            if self._page_pool is not None:
+                return
+            from playwright.async_api import async_playwright
             self.playwright = await async_playwright().start()
             self.browser = await self.playwright.chromium.launch(
                 headless=True,
@@ -51,12 +182,32 @@ class ExtractContent:
                     get: () => ['en-US', 'en']
                 });
             """)
+            await self.context.set_extra_http_headers(_EXTRA_HEADERS)
+            await self.context.route('**/*', self._route_request)
+            
+            # Pages are created once and recycled across extract() calls
+            pool = asyncio.Queue(maxsize=self.pool_size)
+            for _ in range(self.pool_size):
+                pool.put_nowait(await self.context.new_page())
+            self._page_pool = pool
+
+    async def _route_request(self, route):
+        """Abort requests for resources that carry no article text."""
+        if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
 
     def is_valid_url(self, url: str) -> bool:
         if not isinstance(url, str):
             logger.warning(f"URL is not a string: {url}")
             return False
-        if url.lower() in ['pending', 'in_progress', 'complete', 'error']:
+        # Fast path: http(s) URL with a non-empty host, no urlparse needed
+        if url[:8].lower().startswith(_HTTP_SCHEMES):
+            rest = url.split('://', 1)[1]
+            if rest and rest[0] not in '/?#':
+                return True
+        if url.lower() in _STATUS_STRINGS:
             logger.warning(f"URL is a status value: {url}")
             return False
         try:
@@ -72,71 +223,26 @@ class ExtractContent:
     def get_site_specific_selectors(self, url: str) -> list:
         """Get site-specific selectors based on the URL."""
         domain = urlparse(url).netloc.lower()
-        
-        selectors = {
-            'cointelegraph.com': [
-                '.post__content',
-                '.post__content-wrapper',
-                'article',
-                '.article__content',
-                '[itemprop="articleBody"]',
-                '.post-content',
-                '.article-text'
-            ],
-            'crypto.news': [
-                '.article-content',
-                '.post-content',
-                'article',
-                '.entry-content',
-                '[itemprop="articleBody"]',
-                '.content-area'
-            ],
-            'analytickit.com': [
-                '.post-content',
-                '.entry-content',
-                'article',
-                '.article-content',
-                '[itemprop="articleBody"]',
-                '.content'
-            ],
-            'default': [
-                'article',
-                '.article',
-                '.post-content',
-                '.entry-content',
-                'main',
-                '.content',
-                '#content',
-                '.post',
-                '.article-content',
-                '.story-content',
-                '.article-body',
-                '.post-body',
-                '.entry',
-                '.blog-post',
-                '.news-content',
-                '[itemprop="articleBody"]',
-                '.article-text',
-                '.article-body-text',
-                '.article-content-text'
-            ]
-        }
-        
-        return selectors.get(domain, selectors['default'])
+        return _SITE_SELECTORS.get(domain, _SITE_SELECTORS['default'])
 
     async def wait_for_content(self, page, selectors: list) -> bool:
         """Wait for content to load using multiple strategies."""
+        from playwright.async_api import TimeoutError
         try:
-            # Wait for network to be idle
-            await page.wait_for_load_state('networkidle', timeout=10000)
-            
-            # Wait for any of the selectors to be present
-            for selector in selectors:
+            # Wait for whichever content selector appears first
+            content_selector = ', '.join(selectors)
+            try:
+                await page.wait_for_selector(content_selector, timeout=4000)
+            except TimeoutError:
+                pass
+            else:
+                # Client-rendered articles attach the container before the text;
+                # wait for the text itself instead of sleeping a fixed time
                 try:
-                    await page.wait_for_selector(selector, timeout=5000)
-                    return True
+                    await page.wait_for_function(_CONTENT_READY_JS, arg=content_selector, timeout=4000)
                 except TimeoutError:
-                    continue
+                    pass
+                return True
             
             # If no selectors found, wait for body to be present
             await page.wait_for_selector('body', timeout=5000)
@@ -149,36 +255,115 @@ class ExtractContent:
             logger.warning(f"Error waiting for content: {str(e)}")
             return False
 
+    def _extract_text(self, content: str, selectors: list, fallbacks: bool = True) -> str:
+        """Pull the article text out of an HTML document.
+        
+        Args:
+            content (str): Page HTML
+            selectors (list): Content selectors to try, in priority order
+            fallbacks (bool): Also try the main content area and body when no selector matches
+            
+        Returns:
+            str: Normalized text, or "" if nothing long enough was found
+        """
+        # Parse with BeautifulSoup; lxml is much faster than html.parser
+        soup = BeautifulSoup(content, 'lxml')
+        
+        # Text per element, so an element matched by several selectors is read once
+        texts = {}
+        
+        def _text(element) -> str:
+            key = id(element)
+            if key not in texts:
+                # Strip boilerplate inside the candidate only, so a candidate that
+                # itself sits in boilerplate (an article in a .sidebar) is still read
+                for unwanted in _UNWANTED_SEL.select(element):
+                    unwanted.decompose()
+                texts[key] = ' '.join(element.get_text(separator=' ', strip=True).split())
+            return texts[key]
+        
+        # Site selectors first, then the main content area, in one prioritized walk
+        candidates = [(f"selector: {selector}", _compile_selector(selector)) for selector in selectors]
+        if fallbacks:
+            candidates.extend(("main content area", compiled) for compiled in _MAIN_SELS)
+        
+        for label, compiled in candidates:
+            for element in compiled.select(soup):
+                text = _text(element)
+                # Check if we have enough content
+                if len(text) > 100:
+                    logger.info(f"Found content using {label}")
+                    return text
+        
+        # Fallback to body text, but exclude navigation and footer
+        body = soup.body if fallbacks else None
+        if body:
+            for unwanted in _PAGE_CHROME_SEL.select(body):
+                unwanted.decompose()
+            
+            text = ' '.join(body.get_text(separator=' ', strip=True).split())
+            if len(text) > 100:
+                logger.info("Found content in body")
+                return text
+        
+        return ""
+
+    async def _extract_http(self, url: str, selectors: list) -> str:
+        """Try to extract a server-rendered article with a plain GET, without the browser.
+        
+        Only a content-selector match counts, so script-only shells and bot
+        walls fall through to Playwright instead of returning page chrome.
+        """
+        try:
+            if self._http is None or self._http.closed:
+                # aiohttp negotiates Accept-Encoding itself (br only if brotli is installed)
+                headers = {k: v for k, v in _EXTRA_HEADERS.items() if k != 'Accept-Encoding'}
+                # Pooled keep-alive connections and cached DNS for repeat hosts
+                connector = aiohttp.TCPConnector(limit=20, limit_per_host=10, ttl_dns_cache=300, keepalive_timeout=60)
+                self._http = aiohttp.ClientSession(
+                    connector=connector,
+                    headers={**headers, 'User-Agent': self.ua.random},
+                    timeout=aiohttp.ClientTimeout(total=15)
+                )
+            async with self._http.get(url) as resp:
+                if resp.status != 200 or 'html' not in resp.headers.get('Content-Type', ''):
+                    return ""
+                content = await resp.text()
+            return await asyncio.to_thread(self._extract_text, content, selectors, False)
+        except Exception as e:
+            logger.info(f"HTTP fast path failed for {url}, using browser: {str(e)}")
+            return ""
+
     async def extract(self, url: str) -> str:
         if not self.is_valid_url(url):
             logger.error(f"Invalid URL provided: {url}")
             return ""
             
         logger.info(f"Extracting content from valid URL: {url}")
+        
+        # Get site-specific selectors
+        selectors = self.get_site_specific_selectors(url)
+        
+        # Static sites are served by a plain GET; only start Chromium when that fails
+        if urlparse(url).netloc.lower() not in JS_REQUIRED_DOMAINS:
+            text = await self._extract_http(url, selectors)
+            if text:
+                return text
+        
+        page = None
         try:
             # Initialize browser if needed
             await self.init_browser()
             
-            # Create a new page
-            page = await self.context.new_page()
+            # Borrow a page from the pool; replace it if it was closed
+            page = await self._page_pool.get()
+            if page.is_closed():
+                self._page_uses.pop(page, None)
+                page = await self.context.new_page()
             
-            # Set extra headers
-            await page.set_extra_http_headers({
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Sec-Fetch-User': '?1',
-                'Cache-Control': 'max-age=0',
-                'DNT': '1'
-            })
-            
-            # Get site-specific selectors
-            selectors = self.get_site_specific_selectors(url)
+            self._extract_count += 1
+            if self._extract_count % CLEAR_COOKIES_EVERY == 0:
+                await self.context.clear_cookies()
             
             # Navigate to the URL with retry logic
             max_retries = 3
@@ -197,77 +382,96 @@ class ExtractContent:
                     logger.warning(f"Navigation attempt {attempt + 1} failed: {str(e)}")
                     await asyncio.sleep(2 ** attempt)
             
-            # Additional wait for dynamic content
-            await asyncio.sleep(3)
-            
             # Get the page content
             content = await page.content()
             
-            # Parse with BeautifulSoup
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            # Try each selector
-            for selector in selectors:
-                elements = soup.select(selector)
-                if elements:
-                    # Try each element found with this selector
-                    for element in elements:
-                        # Remove unwanted elements
-                        for unwanted in element.select('script, style, .ads, .advertisement, .social-share, .comments, .related-posts, .newsletter, .sidebar, .widget, .share-buttons, .author-bio, .recommended-posts'):
-                            unwanted.decompose()
-                        
-                        # Get text content
-                        text = element.get_text(separator=' ', strip=True)
-                        text = ' '.join(text.split())
-                        
-                        # Check if we have enough content
-                        if len(text) > 100:
-                            logger.info(f"Found content using selector: {selector}")
-                            return text
-            
-            # If no specific content found, try to get the main content area
-            main_content = soup.select_one('main') or soup.select_one('#main') or soup.select_one('.main')
-            
-            if main_content:
-                # Remove unwanted elements
-                for unwanted in main_content.select('script, style, .ads, .advertisement, .social-share, .comments, .related-posts, .newsletter, .sidebar, .widget, .share-buttons, .author-bio, .recommended-posts'):
-                    unwanted.decompose()
-                
-                text = main_content.get_text(separator=' ', strip=True)
-                text = ' '.join(text.split())
-                if len(text) > 100:
-                    logger.info("Found content in main content area")
-                    return text
-            
-            # Fallback to body text, but exclude navigation and footer
-            body = soup.body
-            if body:
-                # Remove unwanted elements
-                for unwanted in body.select('nav, footer, header, .nav, .footer, .header, script, style, .ads, .advertisement, .social-share, .comments, .related-posts, .newsletter, .sidebar, .widget, .share-buttons, .author-bio, .recommended-posts'):
-                    unwanted.decompose()
-                
-                text = body.get_text(separator=' ', strip=True)
-                text = ' '.join(text.split())
-                if len(text) > 100:
-                    logger.info("Found content in body")
-                    return text
-            
-            logger.warning(f"Could not find sufficient content from URL: {url}")
-            return ""
+            # Parsing is CPU-bound; run it in a worker thread so other pages keep loading
+            text = await asyncio.to_thread(self._extract_text, content, selectors)
+            if not text:
+                logger.warning(f"Could not find sufficient content from URL: {url}")
+            return text
             
         except Exception as e:
             logger.error(f"Error extracting content from {url}: {str(e)}")
             return ""
         finally:
-            # Close the page
-            if 'page' in locals():
+            # Return the page to the pool for the next URL
+            if page is not None:
+                await self._release_page(page)
+
+    async def _release_page(self, page):
+        """Blank a borrowed page, or replace it once worn out, and return it to the pool."""
+        uses = self._page_uses.pop(page, 0) + 1
+        if self._page_pool is None:
+            # cleanup() ran while this page was out; nothing to return it to
+            await self._close_page(page)
+            return
+        try:
+            if uses >= PAGE_MAX_USES:
                 await page.close()
+                page = await self.context.new_page()
+                uses = 0
+            else:
+                # Drop the previous document so idle pages hold no DOM
+                await page.goto('about:blank')
+        except Exception as e:
+            logger.warning(f"Error recycling page: {str(e)}")
+        if self._page_pool is None:
+            await self._close_page(page)
+            return
+        self._page_uses[page] = uses
+        self._page_pool.put_nowait(page)
+
+    async def _close_page(self, page):
+        """Close a page, ignoring errors from a context that is already gone."""
+        try:
+            await page.close()
+        except Exception as e:
+            logger.debug("Error closing page: %s", e)
+
+    async def extract_many(self, urls: list, concurrency: int = 4) -> list:
+        """Extract content from several URLs concurrently.
+        
+        Args:
+            urls (list): URLs to extract
+            concurrency (int): Maximum extractions in flight; also bounded by the page pool
+            
+        Returns:
+            list: Extracted text per URL, in input order ("" on failure)
+        """
+        # extract() starts the browser under its lock only when a URL needs it,
+        # so a batch of static pages never launches Chromium
+        sem = asyncio.Semaphore(concurrency)
+        
+        async def _one(url: str) -> str:
+            async with sem:
+                return await self.extract(url)
+        
+        results = await asyncio.gather(*(_one(url) for url in urls), return_exceptions=True)
+        return ["" if isinstance(result, Exception) else result for result in results]
 
     async def cleanup(self):
         """Clean up browser resources."""
-        if self.context:
-            await self.context.close()
-        if self.browser:
-            await self.browser.close()
-        if self.playwright:
-            await self.playwright.stop() 
\ No newline at end of file
+        async with self._browser_lock:
+            # Borrowed pages see the pool gone and close themselves in _release_page
+            pool, self._page_pool = self._page_pool, None
+            while pool is not None and not pool.empty():
+                await self._close_page(pool.get_nowait())
+            self._page_uses.clear()
+            if self._http:
+                await self._http.close()
+                self._http = None
+            if self.context:
+                await self.context.close()
+            if self.browser:
+                await self.browser.close()
+            if self.playwright:
+                await self.playwright.stop()
+            self.context = None
+            self.browser = None
+            self.playwright = None
+
+@lru_cache(maxsize=1)
+def get_extractor() -> ExtractContent:
+    """Return the process-wide ExtractContent so its browser and page pool are shared."""
+    return ExtractContent()
@@ -1,13 +1,52 @@
 import os
+import json
+import hashlib
 import logging
 import gspread
+from gspread.utils import rowcol_to_a1
 from oauth2client.service_account import ServiceAccountCredentials
-from linkedin_api import Linkedin
 from typing import List, Dict, Any
 from datetime import datetime
 from common.llm_orchestrator import LLMOrchestrator
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import asyncio
+import itertools
+
+UGC_POSTS_URL = 'https://api.linkedin.com/v2/ugcPosts'
+
+# Keep-alive pool and retry policy for LinkedIn API calls. Exhausted retries
+# hand back the last response so callers still go through raise_for_status().
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=frozenset({'GET'}),
+    raise_on_status=False
+)
+
+# Creating a post is not idempotent: a gateway 5xx or a read timeout may come
+# after LinkedIn saved it, so only a rate limit is replayed
+_WRITE_RETRY = Retry(
+    total=3,
+    read=0,
+    backoff_factor=0.3,
+    status_forcelist=(429,),
+    allowed_methods=frozenset({'POST'}),
+    raise_on_status=False
+)
+
+# Pending rows rarely change within this many seconds, so reads are reused
+PENDING_TTL = 30
+
+# Generated post text is kept per URL so a retry after a failed post skips the LLM
+CONTENT_CACHE_PATH = os.getenv('LINKEDIN_CONTENT_CACHE', os.path.join('.cache', 'linkedin_content.json'))
+CONTENT_CACHE_TTL = 7 * 24 * 3600
+
+# Upper bound on URLs processed at once by process_and_post
+MAX_CONCURRENCY = 5
 
 # Configure logging
 logging.basicConfig(
@@ -26,8 +65,14 @@ class LinkedInPoster:
         self.access_token = os.getenv('LINKEDIN_ACCESS_TOKEN')
         self.company_id = os.getenv('LINKEDIN_COMPANY_ID', '80256853')  # Default to the provided company ID
         
+        # Pooled HTTP session so consecutive posts reuse the TLS connection
+        self.http = requests.Session()
+        self.http.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=_RETRY))
+        self.http.mount(UGC_POSTS_URL, HTTPAdapter(max_retries=_WRITE_RETRY))
+        
         # Initialize LLM orchestrator
         self.llm = LLMOrchestrator()
+        self._content_cache = self._load_content_cache()
         
         # Validate LinkedIn credentials
         if not self.access_token:
@@ -63,6 +108,10 @@ class LinkedInPoster:
                     self.sheet.update_cell(1, col_index, col)
                     headers.append(col)
                 logger.info("Added missing columns to worksheet")
+            
+            # Header name -> 1-based column index, so updates need no find() scans
+            self._cols = {h.lower(): i + 1 for i, h in enumerate(headers)}
+            self._pending_cache = None  # (fetched_at, pending_urls)
                 
         except Exception as e:
             logger.error(f"Failed to initialize Google Sheets client: {str(e)}")
@@ -74,27 +123,60 @@ class LinkedInPoster:
         Returns:
             List[Dict[str, Any]]: List of URLs with their row numbers
         """
+        if self._pending_cache and time.monotonic() - self._pending_cache[0] < PENDING_TTL:
+            return self._pending_cache[1]
         try:
             logger.info("Fetching pending URLs from Google Sheet")
-            # Get all records
-            records = self.sheet.get_all_records()
+            # Read only the url and status columns instead of every record
+            ranges = []
+            for col_name in ('url', 'status'):
+                start = rowcol_to_a1(2, self._cols[col_name])  # start=2 because row 1 is header
+                ranges.append(f"{start}:{start.rstrip('0123456789')}")
+            url_values, status_values = self.sheet.batch_get(ranges, value_render_option='UNFORMATTED_VALUE')
+            
             pending_urls = []
             
             # Find rows where status is "pending"
-            for i, record in enumerate(records, start=2):  # start=2 because row 1 is header
-                if record.get('status') == 'pending' and record.get('url'):
+            for i, (url_cell, status_cell) in enumerate(itertools.zip_longest(url_values, status_values, fillvalue=[]), start=2):
+                url = url_cell[0] if url_cell else ''
+                if url and status_cell and status_cell[0] == 'pending':
                     pending_urls.append({
                         'row': i,
-                        'url': record['url']
+                        'url': url
                     })
             
             logger.info(f"Found {len(pending_urls)} pending URLs")
+            self._pending_cache = (time.monotonic(), pending_urls)
             return pending_urls
             
         except Exception as e:
             logger.error(f"Error getting pending URLs: {str(e)}")
             return []
 
+    def _load_content_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load unexpired generated content from CONTENT_CACHE_PATH."""
+        if not os.path.exists(CONTENT_CACHE_PATH):
+            return {}
+        try:
+            with open(CONTENT_CACHE_PATH) as f:
+                cache = json.load(f)
+            now = time.time()
+            return {k: v for k, v in cache.items() if now - v.get('ts', 0) < CONTENT_CACHE_TTL}
+        except Exception as e:
+            logger.warning(f"Could not load content cache from {CONTENT_CACHE_PATH}: {str(e)}")
+            return {}
+
+    def _save_content_cache(self):
+        """Write the generated content cache back to disk."""
+        try:
+            cache_dir = os.path.dirname(CONTENT_CACHE_PATH)
+            if cache_dir and not os.path.exists(cache_dir):
+                os.makedirs(cache_dir)
+            with open(CONTENT_CACHE_PATH, 'w') as f:
+                json.dump(self._content_cache, f)
+        except Exception as e:
+            logger.warning(f"Could not save content cache to {CONTENT_CACHE_PATH}: {str(e)}")
+
     async def generate_linkedin_content(self, url: str) -> str:
         """Generate LinkedIn post content using LLM.
         
@@ -104,6 +186,12 @@ class LinkedInPoster:
         Returns:
             str: Generated LinkedIn post content
         """
+        key = hashlib.blake2b(url.encode()).hexdigest()
+        cached = self._content_cache.get(key)
+        if cached and time.time() - cached['ts'] < CONTENT_CACHE_TTL:
+            logger.info("Using cached LinkedIn post content")
+            return cached['content']
+        
         try:
             prompt = f"""Create an engaging LinkedIn post about this content: {url}
             The post should:
@@ -116,12 +204,42 @@ class LinkedInPoster:
             
             content = await self.llm.generate_content(prompt)
             logger.info("Generated LinkedIn post content successfully")
+            self._content_cache[key] = {'content': content, 'ts': time.time()}
+            self._save_content_cache()
             return content
             
         except Exception as e:
             logger.error(f"Error generating LinkedIn content: {str(e)}")
             raise
 
+    def _status_updates(self, row: int, status: str, error: str = "") -> List[Dict[str, Any]]:
+        """Build the batch_update entries recording a URL's status.
+        
+        Args:
+            row (int): Row number to update
+            status (str): New status
+            error (str, optional): Error message if any
+            
+        Returns:
+            List[Dict[str, Any]]: Range/value entries for Worksheet.batch_update
+        """
+        values = {
+            'status': status,
+            'last_update_ts': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'linkedin_result': "success" if status == "posted" else f"error: {error}"
+        }
+        if error:
+            values['error'] = error
+        
+        updates = []
+        for col_name, value in values.items():
+            col = self._cols.get(col_name)
+            if col is None:
+                logger.warning(f"Column {col_name} not found in worksheet")
+                continue
+            updates.append({'range': rowcol_to_a1(row, col), 'values': [[value]]})
+        return updates
+
     def update_sheet_status(self, row: int, status: str, error: str = ""):
         """Update the status of a URL in the Google Sheet.
         
@@ -131,20 +249,9 @@ class LinkedInPoster:
             error (str, optional): Error message if any
         """
         try:
-            # Get current timestamp
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            
-            # Update status and timestamp
-            self.sheet.update_cell(row, self.sheet.find('status').col, status)
-            self.sheet.update_cell(row, self.sheet.find('last_update_ts').col, timestamp)
-            
-            # Update linkedin_result column
-            linkedin_result = "success" if status == "posted" else f"error: {error}"
-            self.sheet.update_cell(row, self.sheet.find('linkedin_result').col, linkedin_result)
-            
-            if error:
-                self.sheet.update_cell(row, self.sheet.find('error').col, error)
-                
+            self.sheet.batch_update(self._status_updates(row, status, error),
+                                    value_input_option='USER_ENTERED')
+            self._pending_cache = None
             logger.info(f"Updated sheet status for row {row}: {status}")
             
         except Exception as e:
@@ -165,7 +272,7 @@ class LinkedInPoster:
             full_content = f"{content}\n\n{url}"
             
             # Prepare the API request
-            api_url = 'https://api.linkedin.com/v2/ugcPosts'
+            api_url = UGC_POSTS_URL
             headers = {
                 'Authorization': f'Bearer {self.access_token}',
                 'X-Restli-Protocol-Version': '2.0.0',
@@ -190,7 +297,7 @@ class LinkedInPoster:
             }
             
             # Make the API request
-            response = requests.post(api_url, headers=headers, json=post_data)
+            response = self.http.post(api_url, headers=headers, json=post_data)
             response.raise_for_status()
             
             logger.info("Successfully posted to LinkedIn")
@@ -198,13 +305,39 @@ class LinkedInPoster:
             
         except Exception as e:
             logger.error(f"Error posting to LinkedIn: {str(e)}")
-            if hasattr(e, 'response'):
+            if getattr(e, 'response', None) is not None:
                 logger.error(f"Response: {e.response.text}")
             return False
 
+    async def _process_url(self, url_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Generate and post content for a single pending URL.
+        
+        Args:
+            url_data (Dict[str, Any]): Pending entry with 'row' and 'url'
+            
+        Returns:
+            List[Dict[str, Any]]: Sheet updates recording the outcome
+        """
+        row = url_data['row']
+        url = url_data['url']
+        try:
+            # Generate content
+            content = await self.generate_linkedin_content(url)
+            
+            # Post to LinkedIn; the request is blocking, so keep it off the event loop
+            if await asyncio.to_thread(self.post_to_linkedin, content, url):
+                return self._status_updates(row, 'posted')
+            return self._status_updates(row, 'error', 'Failed to post to LinkedIn')
+                
+        except Exception as e:
+            logger.error(f"Error processing URL {url}: {str(e)}")
+            return self._status_updates(row, 'error', str(e))
+
     async def process_and_post(self, limit: int = 5):
         """Process pending URLs and post to LinkedIn.
         
+        Up to MAX_CONCURRENCY URLs are generated and posted at the same time.
+        
         Args:
             limit (int, optional): Maximum number of URLs to process. Defaults to 5.
         """
@@ -212,25 +345,27 @@ class LinkedInPoster:
             # Get pending URLs
             pending_urls = self.get_pending_urls()
             
+            sem = asyncio.Semaphore(MAX_CONCURRENCY)
+            
+            async def _bounded(url_data: Dict[str, Any]):
+                async with sem:
+                    updates = await self._process_url(url_data)
+                # Record the outcome as soon as the post finishes so a later
+                # failure can't leave an already-posted URL marked pending
+                if updates:
+                    try:
+                        await asyncio.to_thread(self.sheet.batch_update, updates,
+                                                value_input_option='USER_ENTERED')
+                        logger.info(f"Updated sheet status for row {url_data['row']}")
+                    except Exception as e:
+                        logger.error(f"Error updating sheet status: {str(e)}")
+            
             # Process up to limit URLs
-            for url_data in pending_urls[:limit]:
-                try:
-                    row = url_data['row']
-                    url = url_data['url']
-                    
-                    # Generate content
-                    content = await self.generate_linkedin_content(url)
-                    
-                    # Post to LinkedIn
-                    if self.post_to_linkedin(content, url):
-                        self.update_sheet_status(row, 'posted')
-                    else:
-                        self.update_sheet_status(row, 'error', 'Failed to post to LinkedIn')
-                        
-                except Exception as e:
-                    logger.error(f"Error processing URL {url}: {str(e)}")
-                    self.update_sheet_status(row, 'error', str(e))
+            try:
+                await asyncio.gather(*(_bounded(url_data) for url_data in pending_urls[:limit]))
+            finally:
+                self._pending_cache = None
                     
         except Exception as e:
             logger.error(f"Error in process_and_post: {str(e)}")
-            raise 
\ No newline at end of file
+            raise
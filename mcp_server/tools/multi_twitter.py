@@ -2,20 +2,25 @@
 
 import os
 import time
-import random
 import asyncio
 from playwright.async_api import async_playwright, TimeoutError
 import logging
 from dotenv import load_dotenv, find_dotenv
 from typing import Optional, Dict, List
+from collections import defaultdict
+import shutil
 import subprocess
+from functools import lru_cache
+from common.storage_state import save_storage_state
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Module import runs once per process, so .env is located and parsed only once.
+# Log rather than print: stdout is the MCP stdio transport when the server imports this
 dotenv_path = find_dotenv()
-print("Loading .env from:", dotenv_path)
+logger.debug("Loading .env from: %s", dotenv_path)
 load_dotenv(dotenv_path)
 
 # Get session directory from .env
@@ -23,16 +28,128 @@ SESSION_DIR = os.getenv('PLAYWRIGHT_SESSION_DIR', './playwright_session')
 if not os.path.exists(SESSION_DIR):
     os.makedirs(SESSION_DIR)
 
+# Fail fast (ms) and let the retry loops do the recovering
+DEFAULT_TIMEOUT = 15000
+NAVIGATION_TIMEOUT = 30000
+SELECTOR_TIMEOUT = 10000
+# Short probe for the selector that matched last time before racing the full candidate list
+CACHED_SELECTOR_TIMEOUT = 500
+
+# Not needed to drive the UI; stylesheets stay since X hides testid controls without CSS
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font'})
+
+# When set, the browser we launch listens for CDP on this port and advertises
+# its endpoint in CDP_ENDPOINT_FILE so other processes attach instead of launching
+CDP_PORT = os.getenv('PLAYWRIGHT_CDP_PORT')
+CDP_ENDPOINT_FILE = os.path.join(SESSION_DIR, 'cdp.txt')
+
+# Elements that only render for a logged-in session
+TWEET_INDICATORS = (
+    '[data-testid="tweetTextarea_0"]',  # Tweet composition box
+    '[data-testid="SideNav_NewTweet_Button"]',  # Tweet button in sidebar
+    '[data-testid="primaryColumn"]',  # Main content area
+    '[data-testid="AppTabBar_Home_Link"]',  # Home tab
+    '[data-testid="SideNav_AccountSwitcher_Button"]',  # Account switcher
+)
+
+TWEET_INDICATORS_ANY = ', '.join(TWEET_INDICATORS)
+
+# Search input on the home timeline
+SEARCH_BOX_SELECTORS = (
+    '[data-testid="SearchBox_Search_Input"]',
+    'input[placeholder*="Search"]',
+    'input[aria-label*="Search"]',
+    '[data-testid="searchbox"]',
+)
+
+# "Latest" tab on the search results page
+LATEST_SELECTORS = (
+    '[data-testid="Latest"]',
+    '[data-testid="tab"]:has-text("Latest")',
+    'div[role="tab"]:has-text("Latest")',
+    'div[aria-label*="Latest"]',
+    'div[data-testid="tab"]:has-text("Latest")',
+    'div[role="tab"][aria-selected="false"]:has-text("Latest")',
+    'a[href*="f=live"]',
+    'div[aria-label="Latest"]',
+    'div[data-testid="Latest"]',
+)
+
+# Elements that show search results have rendered
+RESULT_SELECTORS = (
+    '[data-testid="cellInnerDiv"]',
+    '[data-testid="tweet"]',
+    '[data-testid="tweetText"]',
+    'article[data-testid="tweet"]',
+    '[data-testid="tweetTextarea_0"]',  # Sometimes this appears
+)
+
+# Like button candidates, most specific first; matches are filtered by aria-label
+LIKE_SELECTORS = (
+    '[data-testid="like"]',
+    '[aria-label*="Like"]',
+    '[aria-label*="like"]',
+    '[data-testid="unlike"]',  # In case already liked
+    'div[role="button"][aria-label*="Like"]',
+    'div[data-testid="like"]',
+    'div[aria-label*="Like"]',
+    'div[role="button"]',  # More generic, then filter
+)
+
+# Picks the first selector with like buttons (filtered by aria-label) and clicks up to
+# maxLikes of them, skipping already liked tweets and pausing 1-2s between likes
+LIKE_TWEETS_JS = """async ({selectors, maxLikes}) => {
+    let buttons = [];
+    let selector = null;
+    for (const sel of selectors) {
+        buttons = Array.from(document.querySelectorAll(sel))
+            .filter(el => (el.getAttribute('aria-label') || '').toLowerCase().includes('like'));
+        if (buttons.length) {
+            selector = sel;
+            break;
+        }
+    }
+    let liked = 0;
+    let skipped = 0;
+    for (const button of buttons.slice(0, maxLikes)) {
+        if ((button.getAttribute('aria-label') || '').includes('Unlike')) {
+            skipped++;
+            continue;
+        }
+        button.click();
+        liked++;
+        await new Promise(resolve => setTimeout(resolve, 1000 + Math.random() * 1000));
+    }
+    return {found: buttons.length, selector, liked, skipped};
+}"""
+
+# Cookies and local storage saved per account after a successful login
+STATE_FILE = 'state.json'
+
+BROWSER_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-accelerated-2d-canvas',
+    '--disable-gpu',
+    '--window-size=1280,800',
+    '--disable-web-security',
+    '--disable-features=IsolateOrigins,site-per-process'
+]
+
+@lru_cache(maxsize=1)
 def is_x_server_running():
-    """Check if X Server is running."""
+    """Check if X Server is running (probed once per process)."""
+    if not shutil.which('xdpyinfo'):
+        return False
     try:
-        subprocess.run(['xdpyinfo'], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        return True
-    except:
+        result = subprocess.run(['xdpyinfo'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=1)
+        return result.returncode == 0
+    except Exception:
         return False
 
 class MultiTwitterPlaywright:
-    def __init__(self):
+    def __init__(self, cdp_endpoint: Optional[str] = None):
         # Initialize multiple Twitter accounts
         self.accounts = {
             'primary': {
@@ -52,24 +169,72 @@ class MultiTwitterPlaywright:
             if not os.path.exists(account_data['session_dir']):
                 os.makedirs(account_data['session_dir'])
         
-        # Check if X Server is running, if not, force headless mode
-        self.headless = not is_x_server_running() or os.getenv('HEADLESS', 'true').lower() == 'true'
-        self.browsers = {}
+        # Headless unless explicitly disabled and an X Server is available
+        self.headless = os.getenv('HEADLESS', 'true').lower() == 'true'
+        if not self.headless and not is_x_server_running():
+            logger.warning("X Server not detected, forcing headless mode")
+            self.headless = True
         self.contexts = {}
         self.pages = {}
         self._logged_in = {}
+        # One operation per account at a time; different accounts still run in parallel
+        self._locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
         self.max_retries = 3
+        # One Playwright driver and one browser back every account; each account gets its own context
         self.playwright = None
+        self.browser = None
+        self._browser_lock = asyncio.Lock()
+        self._advertised_endpoint = False
+        # When set, accounts get contexts in an already running Chromium instead of a launched one
+        self.cdp_endpoint = cdp_endpoint or os.getenv('PLAYWRIGHT_CDP_ENDPOINT')
+        # Candidate tuple -> selector that matched last, shared by all accounts since they see the same DOM
+        self._selector_hits: Dict[tuple, str] = {}
         
         logger.info(f"MultiTwitterPlaywright initialized with:")
         for account_name, account_data in self.accounts.items():
             logger.info(f"- {account_name}: {account_data['username']}")
         logger.info(f"- Headless mode: {self.headless}")
-        logger.info(f"- X Server running: {is_x_server_running()}")
+
+    async def _race_selectors(self, page, selectors, timeout: int):
+        """Wait for several selectors at once and return the first (selector, element) to appear.
         
-        if not self.headless and not is_x_server_running():
-            logger.warning("X Server not detected, forcing headless mode")
-            self.headless = True
+        The selector that won the previous race for the same candidates is probed
+        alone first, so warm calls cost one browser wait instead of one per candidate.
+        
+        Args:
+            page: Page to probe.
+            selectors: Candidate CSS selectors.
+            timeout: Per-selector timeout in milliseconds.
+            
+        Returns:
+            Tuple of the matching selector and its element, or (None, None) if none appeared.
+        """
+        cached = self._selector_hits.get(selectors)
+        if cached:
+            try:
+                element = await page.wait_for_selector(cached, timeout=CACHED_SELECTOR_TIMEOUT)
+                if element:
+                    return cached, element
+            except Exception:
+                logger.debug("Cached selector %s missed, racing all candidates", cached)
+        
+        tasks = {
+            asyncio.create_task(page.wait_for_selector(selector, timeout=timeout)): selector
+            for selector in selectors
+        }
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and task.result():
+                        self._selector_hits[selectors] = tasks[task]
+                        return tasks[task], task.result()
+            return None, None
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
     async def check_login_status(self, account_name: str):
         """Check if user is logged in by verifying we're on the home page and can see tweet composition elements."""
@@ -82,34 +247,20 @@ class MultiTwitterPlaywright:
         
         # First check if we're on the home page
         current_url = page.url
-        logger.info(f"Current URL for {account_name}: {current_url}")
+        logger.debug("Current URL for %s: %s", account_name, current_url)
         
         if 'login' in current_url.lower():
             logger.info(f"On login page for {account_name}, not logged in")
             return False
             
-        # Wait a bit for the page to stabilize
-        await page.wait_for_timeout(3000)
-        
-        # Check for tweet composition elements that only appear when logged in
-        tweet_indicators = [
-            '[data-testid="tweetTextarea_0"]',  # Tweet composition box
-            '[data-testid="SideNav_NewTweet_Button"]',  # Tweet button in sidebar
-            '[data-testid="primaryColumn"]',  # Main content area
-            '[data-testid="AppTabBar_Home_Link"]',  # Home tab
-            '[data-testid="SideNav_AccountSwitcher_Button"]'  # Account switcher
-        ]
+        # Let the document finish parsing before probing for elements
+        await page.wait_for_load_state('domcontentloaded')
         
-        for selector in tweet_indicators:
-            try:
-                logger.info(f"Checking for {selector} on {account_name}")
-                element = await page.query_selector(selector)
-                if element:
-                    logger.info(f"Found logged-in indicator: {selector} for {account_name}")
-                    return True
-            except Exception as e:
-                logger.warning(f"Error checking {selector} for {account_name}: {str(e)}")
-                continue
+        logger.debug("Checking logged-in indicators on %s", account_name)
+        selector, _ = await self._race_selectors(page, TWEET_INDICATORS, timeout=5000)
+        if selector:
+            logger.info(f"Found logged-in indicator: {selector} for {account_name}")
+            return True
         
         # If we're on the home page but don't see login form, assume we're logged in
         if 'home' in current_url.lower():
@@ -121,40 +272,86 @@ class MultiTwitterPlaywright:
         logger.info(f"No login indicators found for {account_name}, assuming not logged in")
         return False
 
+    def _state_path(self, account_name: str) -> str:
+        """Path of the saved storage state for an account."""
+        return os.path.join(self.accounts[account_name]['session_dir'], STATE_FILE)
+
+    async def _ensure_playwright(self):
+        """Start the Playwright driver and the shared browser once for all accounts."""
+        async with self._browser_lock:
+            if not self.playwright:
+                self.playwright = await async_playwright().start()
+            
+            if not self.browser:
+                if self.cdp_endpoint:
+                    logger.info(f"Connecting to shared browser over CDP at {self.cdp_endpoint}")
+                    self.browser = await self.playwright.chromium.connect_over_cdp(self.cdp_endpoint)
+                elif CDP_PORT:
+                    self.browser = await self._connect_advertised_browser()
+                
+                if not self.browser:
+                    logger.info(f"Launching shared browser (headless={self.headless})")
+                    args = BROWSER_ARGS + [f'--remote-debugging-port={CDP_PORT}'] if CDP_PORT else BROWSER_ARGS
+                    self.browser = await self.playwright.chromium.launch(
+                        headless=self.headless,
+                        args=args
+                    )
+                    if CDP_PORT:
+                        with open(CDP_ENDPOINT_FILE, 'w') as f:
+                            f.write(f"http://127.0.0.1:{CDP_PORT}")
+                        self._advertised_endpoint = True
+        return self.browser
+
+    async def _connect_advertised_browser(self):
+        """Attach to a browser another process advertised in CDP_ENDPOINT_FILE, if it is still alive."""
+        if not os.path.exists(CDP_ENDPOINT_FILE):
+            return None
+        with open(CDP_ENDPOINT_FILE) as f:
+            endpoint = f.read().strip()
+        try:
+            browser = await self.playwright.chromium.connect_over_cdp(endpoint)
+            logger.info(f"Attached to shared browser over CDP at {endpoint}")
+            return browser
+        except Exception as e:
+            logger.info(f"Advertised browser at {endpoint} is not reachable, launching a new one: {str(e)}")
+            return None
+
+    async def _save_state(self, account_name: str):
+        """Persist cookies and local storage so the next run can skip the login flow."""
+        try:
+            await save_storage_state(self.contexts[account_name], self._state_path(account_name))
+            logger.info(f"Saved session state for {account_name}")
+        except Exception as e:
+            logger.warning(f"Could not save session state for {account_name}: {str(e)}")
+
+    async def _route_request(self, route):
+        """Abort requests for resources the bot never looks at."""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
     async def _init_browser(self, account_name: str):
-        """Initialize the browser in persistent context mode for a specific account."""
+        """Initialize an isolated browser context for a specific account."""
         try:
-            account_data = self.accounts[account_name]
-            session_dir = account_data['session_dir']
-            
-            logger.info(f"Initializing browser for {account_name} with session dir: {session_dir}")
-            
-            self.playwright = await async_playwright().start()
-            
-            # Launch browser with persistent context
-            self.browsers[account_name] = await self.playwright.chromium.launch_persistent_context(
-                user_data_dir=session_dir,
-                headless=self.headless,
-                args=[
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-accelerated-2d-canvas',
-                    '--disable-gpu',
-                    '--window-size=1280,800',
-                    '--disable-web-security',
-                    '--disable-features=IsolateOrigins,site-per-process'
-                ],
+            state_path = self._state_path(account_name)
+            
+            logger.info(f"Initializing browser context for {account_name} with state file: {state_path}")
+            
+            browser = await self._ensure_playwright()
+            context = await browser.new_context(
+                storage_state=state_path if os.path.exists(state_path) else None,
                 viewport={'width': 1280, 'height': 800},
                 ignore_https_errors=True
             )
-            
-            self.contexts[account_name] = self.browsers[account_name]
-            self.pages[account_name] = await self.contexts[account_name].new_page()
+            await context.route('**/*', self._route_request)
+            page = await context.new_page()
+            self.contexts[account_name] = context
+            self.pages[account_name] = page
             
             # Set default timeouts
-            self.pages[account_name].set_default_timeout(120000)
-            self.pages[account_name].set_default_navigation_timeout(120000)
+            page.set_default_timeout(DEFAULT_TIMEOUT)
+            page.set_default_navigation_timeout(NAVIGATION_TIMEOUT)
             
             logger.info(f"Browser initialized for {account_name}")
             
@@ -163,23 +360,27 @@ class MultiTwitterPlaywright:
             for attempt in range(max_retries):
                 try:
                     logger.info(f"Navigation attempt {attempt + 1}/{max_retries} for {account_name}")
-                    await self.pages[account_name].goto("https://x.com/home", wait_until='domcontentloaded', timeout=60000)
+                    await page.goto("https://x.com/home", wait_until='domcontentloaded', timeout=15000)
                     
-                    # Wait for either the main content or login form
+                    # Wait for whichever renders first: the main content or a login form
                     logger.info(f"Waiting for page content to load for {account_name}...")
                     try:
-                        await self.pages[account_name].wait_for_selector('[data-testid="primaryColumn"], input[name="session[username_or_email]"]', 
-                                                        state='visible', 
-                                                        timeout=30000)
+                        await page.wait_for_selector(
+                            '[data-testid="primaryColumn"], input[name="session[username_or_email]"], input[autocomplete="username"]',
+                            state='visible',
+                            timeout=DEFAULT_TIMEOUT
+                        )
                     except Exception as e:
                         logger.warning(f"Timeout waiting for main content or login form for {account_name}: {str(e)}")
                     
-                    # Additional wait for page stability
-                    await self.pages[account_name].wait_for_timeout(5000)
-                    
                     # Check if we're actually on the home page
-                    current_url = self.pages[account_name].url
-                    logger.info(f"Current URL for {account_name}: {current_url}")
+                    current_url = page.url
+                    logger.debug("Current URL for %s: %s", account_name, current_url)
+                    
+                    # A redirect to the login flow means the session is gone; reloading won't bring it back
+                    if 'login' in current_url.lower():
+                        logger.info(f"Redirected to login for {account_name}, will need to login")
+                        break
                     
                     if 'home' in current_url.lower():
                         # Use robust login status check
@@ -189,12 +390,12 @@ class MultiTwitterPlaywright:
                         if login_status:
                             logger.info(f"Already logged in for {account_name} (session restored)")
                             self._logged_in[account_name] = True
+                            # X rotates auth cookies, keep the saved state current
+                            await self._save_state(account_name)
                             return True
                     
                     if attempt < max_retries - 1:
                         logger.info(f"Navigation attempt failed for {account_name}, retrying...")
-                        await self.pages[account_name].reload()
-                        await self.pages[account_name].wait_for_timeout(5000)
                     else:
                         logger.info(f"All navigation attempts failed for {account_name}, will need to login")
                         
@@ -202,7 +403,7 @@ class MultiTwitterPlaywright:
                     logger.warning(f"Navigation attempt {attempt + 1} failed for {account_name}: {str(e)}")
                     if attempt < max_retries - 1:
                         logger.info(f"Retrying navigation for {account_name}...")
-                        await self.pages[account_name].wait_for_timeout(5000)
+                        await page.wait_for_timeout(5000)
                     else:
                         logger.info(f"All navigation attempts failed for {account_name}, will need to login")
             
@@ -212,7 +413,7 @@ class MultiTwitterPlaywright:
             logger.error(f"Error initializing browser for {account_name}: {str(e)}")
             return False
 
-    async def _wait_for_selector(self, selector: str, timeout: int = 30000, account_name: str = 'primary') -> Optional[any]:
+    async def _wait_for_selector(self, selector: str, timeout: int = SELECTOR_TIMEOUT, account_name: str = 'primary') -> Optional[any]:
         """Wait for a selector to appear on the page."""
         try:
             page = self.pages.get(account_name)
@@ -243,60 +444,29 @@ class MultiTwitterPlaywright:
                 logger.error(f"No page found for account {account_name}")
                 return False
             
+            # Drop cookies from a stale saved session before starting a fresh login
+            if os.path.exists(self._state_path(account_name)):
+                logger.info(f"Saved session for {account_name} is stale, logging in again")
+                await self.contexts[account_name].clear_cookies()
+            
             # Navigate to Twitter login page
-            await page.goto('https://twitter.com/i/flow/login', wait_until='networkidle')
-            await page.wait_for_timeout(5000)
+            # X never goes network-idle (websockets, telemetry), so wait for the form instead
+            await page.goto('https://twitter.com/i/flow/login', wait_until='domcontentloaded', timeout=NAVIGATION_TIMEOUT)
             
             # Enter username
             logger.info(f"Entering username for {account_name}...")
-            username_input = await page.wait_for_selector('input[autocomplete="username"]', timeout=60000)
+            username_input = await page.wait_for_selector('input[autocomplete="username"]', timeout=DEFAULT_TIMEOUT)
             if not username_input:
                 raise Exception(f"Could not find username input field for {account_name}")
             await username_input.fill(username)
-            await page.wait_for_timeout(2000)
             
-            # Click Next button - try multiple selectors
+            # Click Next button - the locator waits for whichever variant renders first
             logger.info(f"Clicking Next button for {account_name}...")
-            next_button = None
-            
-            # First try data-testid
             try:
-                next_button = await page.wait_for_selector('[data-testid="LoginNextButton"]', timeout=10000)
-                if next_button:
-                    await next_button.click()
-            except:
-                pass
-            
-            # If not found, try role and text
-            if not next_button:
-                try:
-                    await page.get_by_role("button", name="Next").click()
-                    next_button = True
-                except:
-                    pass
-            
-            # If still not found, try text content
-            if not next_button:
-                try:
-                    await page.get_by_text("Next").click()
-                    next_button = True
-                except:
-                    pass
-            
-            # If still not found, try evaluating JavaScript
-            if not next_button:
-                try:
-                    next_button = await page.evaluate('''() => {
-                        const buttons = Array.from(document.querySelectorAll('div[role="button"]'));
-                        return buttons.find(button => button.textContent.includes('Next'));
-                    }''')
-                    if next_button:
-                        await page.click('div[role="button"]:has-text("Next")')
-                        next_button = True
-                except:
-                    pass
-            
-            if not next_button:
+                await page.locator(
+                    '[data-testid="LoginNextButton"], button:has-text("Next"), div[role="button"]:has-text("Next")'
+                ).first.click(timeout=SELECTOR_TIMEOUT)
+            except TimeoutError:
                 raise Exception(f"Could not find Next button for {account_name}")
             
             # Wait for password field to appear
@@ -304,70 +474,37 @@ class MultiTwitterPlaywright:
             try:
                 # Wait for the password field to be visible
                 await page.wait_for_selector('input[name="password"]', state='visible', timeout=10000)
-                await page.wait_for_timeout(2000)  # Additional wait to ensure field is ready
             except:
                 logger.error(f"Password field did not appear after clicking Next for {account_name}")
                 raise Exception(f"Password field not found for {account_name}")
             
             # Enter password
             logger.info(f"Entering password for {account_name}...")
-            password_input = await page.wait_for_selector('input[name="password"]', timeout=60000)
+            password_input = await page.wait_for_selector('input[name="password"]', timeout=SELECTOR_TIMEOUT)
             if not password_input:
                 raise Exception(f"Could not find password input field for {account_name}")
             await password_input.fill(password)
-            await page.wait_for_timeout(2000)
             
-            # Click Login button - try multiple selectors
+            # Click Login button - the locator waits for whichever variant renders first
             logger.info(f"Clicking Login button for {account_name}...")
-            login_button = None
-            
-            # First try data-testid
             try:
-                login_button = await page.wait_for_selector('[data-testid="LoginForm_Login_Button"]', timeout=10000)
-                if login_button:
-                    await login_button.click()
-            except:
-                pass
-            
-            # If not found, try role and text
-            if not login_button:
-                try:
-                    await page.get_by_role("button", name="Log in").click()
-                    login_button = True
-                except:
-                    pass
-            
-            # If still not found, try text content
-            if not login_button:
-                try:
-                    await page.get_by_text("Log in").click()
-                    login_button = True
-                except:
-                    pass
-            
-            # If still not found, try evaluating JavaScript
-            if not login_button:
-                try:
-                    login_button = await page.evaluate('''() => {
-                        const buttons = Array.from(document.querySelectorAll('div[role="button"]'));
-                        return buttons.find(button => button.textContent.includes('Log in'));
-                    }''')
-                    if login_button:
-                        await page.click('div[role="button"]:has-text("Log in")')
-                        login_button = True
-                except:
-                    pass
-            
-            if not login_button:
+                await page.locator(
+                    '[data-testid="LoginForm_Login_Button"], button:has-text("Log in"), div[role="button"]:has-text("Log in")'
+                ).first.click(timeout=SELECTOR_TIMEOUT)
+            except TimeoutError:
                 raise Exception(f"Could not find Login button for {account_name}")
             
             # Wait for login to complete
-            await page.wait_for_timeout(5000)
+            try:
+                await page.wait_for_selector(TWEET_INDICATORS_ANY, timeout=15000)
+            except TimeoutError:
+                logger.warning(f"Home timeline did not appear after login for {account_name}")
             
             # Check if login was successful
             if await self.check_login_status(account_name):
                 logger.info(f"Successfully logged in for {account_name}")
                 self._logged_in[account_name] = True
+                await self._save_state(account_name)
                 return True
             else:
                 logger.error(f"Login failed for {account_name}")
@@ -381,7 +518,7 @@ class MultiTwitterPlaywright:
         """Ensure the specified account is logged in."""
         try:
             # Initialize browser if not already done
-            if account_name not in self.browsers:
+            if account_name not in self.contexts:
                 if not await self._init_browser(account_name):
                     return False
             
@@ -398,8 +535,27 @@ class MultiTwitterPlaywright:
             logger.error(f"Error ensuring login for {account_name}: {str(e)}")
             return False
 
+    async def _ensure_logged_in_locked(self, account_name: str) -> bool:
+        async with self._locks[account_name]:
+            return await self.ensure_logged_in(account_name)
+
+    async def ensure_all_logged_in(self) -> Dict[str, bool]:
+        """Initialize and log in every account concurrently."""
+        results = await asyncio.gather(
+            *(self._ensure_logged_in_locked(account_name) for account_name in self.accounts),
+            return_exceptions=True
+        )
+        return {
+            account_name: result is True
+            for account_name, result in zip(self.accounts, results)
+        }
+
     async def post_tweet(self, text: str, account_name: str = 'primary') -> bool:
         """Post a tweet using the specified account."""
+        async with self._locks[account_name]:
+            return await self._post_tweet(text, account_name)
+
+    async def _post_tweet(self, text: str, account_name: str) -> bool:
         try:
             logger.info(f"Attempting to post tweet with {account_name}: {text[:50]}...")
             
@@ -414,35 +570,30 @@ class MultiTwitterPlaywright:
                 return False
             
             # Navigate to home page
-            await page.goto('https://twitter.com/home')
-            await page.wait_for_timeout(3000)
+            await page.goto('https://twitter.com/home', wait_until='domcontentloaded')
             
-            # Find and click the tweet composition button
-            tweet_button = await self._wait_for_selector('[data-testid="SideNav_NewTweet_Button"]', account_name=account_name)
-            if not tweet_button:
+            # Locator actions auto-wait for the element, so each step is a single round-trip
+            try:
+                await page.locator('[data-testid="SideNav_NewTweet_Button"]').click(timeout=SELECTOR_TIMEOUT)
+            except TimeoutError:
                 logger.error(f"Tweet button not found for {account_name}")
                 return False
             
-            await tweet_button.click()
-            await page.wait_for_timeout(2000)
-            
-            # Find the tweet textarea and enter text
-            textarea = await self._wait_for_selector('[data-testid="tweetTextarea_0"]', account_name=account_name)
-            if not textarea:
+            try:
+                await page.locator('[data-testid="tweetTextarea_0"]').fill(text, timeout=SELECTOR_TIMEOUT)
+            except TimeoutError:
                 logger.error(f"Tweet textarea not found for {account_name}")
                 return False
             
-            await textarea.fill(text)
-            await page.wait_for_timeout(1000)
-            
-            # Click the tweet button
-            post_button = await self._wait_for_selector('[data-testid="tweetButton"]', account_name=account_name)
-            if not post_button:
+            try:
+                await page.locator('[data-testid="tweetButton"]').click(timeout=SELECTOR_TIMEOUT)
+            except TimeoutError:
                 logger.error(f"Post button not found for {account_name}")
                 return False
             
-            await post_button.click()
-            await page.wait_for_timeout(3000)
+            # The confirmation toast shows once the tweet has been accepted
+            if not await self._wait_for_selector('[data-testid="toast"]', timeout=10000, account_name=account_name):
+                logger.warning(f"No post confirmation seen for {account_name}")
             
             logger.info(f"Tweet posted successfully with {account_name}")
             return True
@@ -451,8 +602,83 @@ class MultiTwitterPlaywright:
             logger.error(f"Error posting tweet with {account_name}: {str(e)}")
             return False
 
+    def _results_by_account(self, action: str, account_names, results) -> Dict[str, bool]:
+        """Map gather(return_exceptions=True) results to per-account booleans.
+        
+        Exceptions are logged with the account they came from before they are
+        reported as False, so a failure is not lost behind a generic message.
+        """
+        outcome = {}
+        for account_name, result in zip(account_names, results):
+            if isinstance(result, BaseException):
+                logger.error(f"{action} failed for {account_name}: {type(result).__name__}: {result}")
+            outcome[account_name] = result is True
+        return outcome
+
+    async def post_tweet_all(self, text: str) -> Dict[str, bool]:
+        """Post the same tweet from every account concurrently."""
+        results = await asyncio.gather(
+            *(self.post_tweet(text, account_name) for account_name in self.accounts),
+            return_exceptions=True
+        )
+        return self._results_by_account("Posting tweet", self.accounts, results)
+
+    async def search_and_like_all(self, search_terms: Dict[str, str], max_likes: int = 5) -> Dict[str, bool]:
+        """Search and like on several accounts concurrently.
+        
+        Args:
+            search_terms: Search term to use for each account name.
+            max_likes: Maximum likes per account.
+            
+        Returns:
+            Whether each account liked at least one tweet.
+        """
+        results = await asyncio.gather(
+            *(self.search_and_like_tweets(term, max_likes, account_name)
+              for account_name, term in search_terms.items()),
+            return_exceptions=True
+        )
+        return self._results_by_account("Search and like", search_terms, results)
+
+    async def _scroll_for_more(self, page, scroll_count: int, timeout: int) -> int:
+        """Scroll the timeline, waiting adaptively for each batch of tweets to load.
+        
+        After every scroll the page height is polled, starting at 200ms and doubling
+        up to 3s while nothing new has loaded; growth moves on to the next scroll at once.
+        
+        Args:
+            page: Page showing the timeline.
+            scroll_count: Number of scroll steps.
+            timeout: Overall time budget in milliseconds.
+            
+        Returns:
+            Number of scroll steps that loaded more content.
+        """
+        deadline = time.monotonic() + timeout / 1000
+        height = await page.evaluate("document.body.scrollHeight")
+        loaded = 0
+        for _ in range(scroll_count):
+            await page.evaluate("window.scrollBy(0, 1000)")
+            delay = 200
+            while time.monotonic() < deadline:
+                await page.wait_for_timeout(delay)
+                new_height = await page.evaluate("document.body.scrollHeight")
+                if new_height > height:
+                    height = new_height
+                    loaded += 1
+                    break
+                delay = min(delay * 2, 3000)
+            else:
+                logger.debug("Scroll budget of %dms used up", timeout)
+                break
+        return loaded
+
     async def search_and_like_tweets(self, search_term: str, max_likes: int = 5, account_name: str = 'primary') -> bool:
         """Search for tweets and like them using the specified account."""
+        async with self._locks[account_name]:
+            return await self._search_and_like_tweets(search_term, max_likes, account_name)
+
+    async def _search_and_like_tweets(self, search_term: str, max_likes: int, account_name: str) -> bool:
         max_retries = 2  # Try up to 2 times
         
         for attempt in range(max_retries):
@@ -478,75 +704,39 @@ class MultiTwitterPlaywright:
                     
                     # Navigate to home page
                     await page.goto('https://x.com/home', wait_until='domcontentloaded', timeout=30000)
-                    await page.wait_for_timeout(3000)
                     
-                    # Try to find and use search box
-                    search_selectors = [
-                        '[data-testid="SearchBox_Search_Input"]',
-                        'input[placeholder*="Search"]',
-                        'input[aria-label*="Search"]',
-                        '[data-testid="searchbox"]'
-                    ]
-                    
-                    search_box = None
-                    for selector in search_selectors:
-                        try:
-                            search_box = await page.wait_for_selector(selector, timeout=5000)
-                            if search_box:
-                                logger.info(f"Found search box with selector '{selector}' for {account_name}")
-                                break
-                        except:
-                            continue
+                    selector, search_box = await self._race_selectors(page, SEARCH_BOX_SELECTORS, timeout=5000)
+                    if search_box:
+                        logger.info(f"Found search box with selector '{selector}' for {account_name}")
                     
                     if search_box:
                         await search_box.click()
-                        await page.wait_for_timeout(1000)
                         await search_box.fill(search_term)
-                        await page.wait_for_timeout(1000)
                         await page.keyboard.press('Enter')
-                        await page.wait_for_timeout(3000)
                         
-                        # Wait for search results to load
-                        await page.wait_for_timeout(2000)
+                        # Wait for the search results page
+                        try:
+                            await page.wait_for_url('**/search**', timeout=10000)
+                        except TimeoutError:
+                            logger.warning(f"Search results page did not load for {account_name}")
                         
                         # Check if we're on a search results page
                         current_url = page.url
-                        logger.info(f"After search, current URL: {current_url}")
+                        logger.debug("After search, current URL: %s", current_url)
                         
                         # Try to select "Latest" filter after search
                         try:
                             logger.info(f"Attempting to select 'Latest' filter after search for {account_name}...")
                             
-                            # Wait for the filter buttons to appear
-                            await page.wait_for_timeout(3000)
-                            
-                            # Try multiple selectors for the Latest filter
-                            latest_selectors = [
-                                '[data-testid="Latest"]',
-                                '[data-testid="tab"]:has-text("Latest")',
-                                'div[role="tab"]:has-text("Latest")',
-                                'div[aria-label*="Latest"]',
-                                'div[data-testid="tab"]:has-text("Latest")',
-                                'div[role="tab"][aria-selected="false"]:has-text("Latest")',
-                                'a[href*="f=live"]',
-                                'div[role="tab"]:has-text("Latest")',
-                                'div[aria-label="Latest"]',
-                                'div[data-testid="Latest"]'
-                            ]
-                            
                             latest_selected = False
-                            for selector in latest_selectors:
+                            selector, latest_button = await self._race_selectors(page, LATEST_SELECTORS, timeout=3000)
+                            if latest_button:
                                 try:
-                                    latest_button = await page.wait_for_selector(selector, timeout=3000)
-                                    if latest_button:
-                                        await latest_button.click()
-                                        logger.info(f"Successfully clicked 'Latest' filter with selector '{selector}' for {account_name}")
-                                        latest_selected = True
-                                        await page.wait_for_timeout(2000)  # Wait for filter to apply
-                                        break
+                                    await latest_button.click()
+                                    logger.info(f"Successfully clicked 'Latest' filter with selector '{selector}' for {account_name}")
+                                    latest_selected = True
                                 except Exception as e:
                                     logger.warning(f"Selector '{selector}' failed for Latest filter on {account_name}: {str(e)}")
-                                    continue
                             
                             # If selectors didn't work, try JavaScript approach
                             if not latest_selected:
@@ -570,7 +760,6 @@ class MultiTwitterPlaywright:
                                     if latest_clicked:
                                         logger.info(f"Successfully clicked 'Latest' filter using JavaScript for {account_name}")
                                         latest_selected = True
-                                        await page.wait_for_timeout(2000)
                                     
                                 except Exception as e:
                                     logger.warning(f"JavaScript approach failed for Latest filter on {account_name}: {str(e)}")
@@ -581,7 +770,6 @@ class MultiTwitterPlaywright:
                                     logger.info(f"Trying direct URL with Latest filter for {account_name}...")
                                     latest_url = f'https://x.com/search?q={search_term}&src=typed_query&f=live'
                                     await page.goto(latest_url, wait_until='domcontentloaded', timeout=30000)
-                                    await page.wait_for_timeout(3000)
                                     logger.info(f"Navigated to Latest filter URL for {account_name}")
                                     latest_selected = True
                                 except Exception as e:
@@ -608,7 +796,6 @@ class MultiTwitterPlaywright:
                         
                         # Set shorter timeout for navigation
                         await page.goto(search_url, wait_until='domcontentloaded', timeout=30000)
-                        await page.wait_for_timeout(3000)
                         
                         # Check if we're on a search page
                         current_url = page.url
@@ -619,36 +806,15 @@ class MultiTwitterPlaywright:
                             try:
                                 logger.info(f"Attempting to select 'Latest' filter for {account_name}...")
                                 
-                                # Wait for the filter buttons to appear
-                                await page.wait_for_timeout(3000)
-                                
-                                # Try multiple selectors for the Latest filter
-                                latest_selectors = [
-                                    '[data-testid="Latest"]',
-                                    '[data-testid="tab"]:has-text("Latest")',
-                                    'div[role="tab"]:has-text("Latest")',
-                                    'div[aria-label*="Latest"]',
-                                    'div[data-testid="tab"]:has-text("Latest")',
-                                    'div[role="tab"][aria-selected="false"]:has-text("Latest")',
-                                    'a[href*="f=live"]',
-                                    'div[role="tab"]:has-text("Latest")',
-                                    'div[aria-label="Latest"]',
-                                    'div[data-testid="Latest"]'
-                                ]
-                                
                                 latest_selected = False
-                                for selector in latest_selectors:
+                                selector, latest_button = await self._race_selectors(page, LATEST_SELECTORS, timeout=3000)
+                                if latest_button:
                                     try:
-                                        latest_button = await page.wait_for_selector(selector, timeout=3000)
-                                        if latest_button:
-                                            await latest_button.click()
-                                            logger.info(f"Successfully clicked 'Latest' filter with selector '{selector}' for {account_name}")
-                                            latest_selected = True
-                                            await page.wait_for_timeout(2000)  # Wait for filter to apply
-                                            break
+                                        await latest_button.click()
+                                        logger.info(f"Successfully clicked 'Latest' filter with selector '{selector}' for {account_name}")
+                                        latest_selected = True
                                     except Exception as e:
                                         logger.warning(f"Selector '{selector}' failed for Latest filter on {account_name}: {str(e)}")
-                                        continue
                                 
                                 # If selectors didn't work, try JavaScript approach
                                 if not latest_selected:
@@ -672,7 +838,6 @@ class MultiTwitterPlaywright:
                                         if latest_clicked:
                                             logger.info(f"Successfully clicked 'Latest' filter using JavaScript for {account_name}")
                                             latest_selected = True
-                                            await page.wait_for_timeout(2000)
                                         
                                     except Exception as e:
                                         logger.warning(f"JavaScript approach failed for Latest filter on {account_name}: {str(e)}")
@@ -683,7 +848,6 @@ class MultiTwitterPlaywright:
                                         logger.info(f"Trying direct URL with Latest filter for {account_name}...")
                                         latest_url = f'https://x.com/search?q={search_term}&src=typed_query&f=live'
                                         await page.goto(latest_url, wait_until='domcontentloaded', timeout=30000)
-                                        await page.wait_for_timeout(3000)
                                         logger.info(f"Navigated to Latest filter URL for {account_name}")
                                         latest_selected = True
                                     except Exception as e:
@@ -712,29 +876,13 @@ class MultiTwitterPlaywright:
                         return False
                 
                 # Wait for search results with shorter timeout
-                timeout = 15000 if account_name == 'secondary' else 20000
+                timeout = 8000 if account_name == 'secondary' else 10000
                 logger.info(f"Waiting for search results to load for {account_name} with timeout {timeout}ms...")
                 
-                # Try multiple selectors for search results with shorter timeouts
-                result_selectors = [
-                    '[data-testid="cellInnerDiv"]',
-                    '[data-testid="tweet"]',
-                    '[data-testid="tweetText"]',
-                    'article[data-testid="tweet"]',
-                    '[data-testid="tweetTextarea_0"]'  # Sometimes this appears
-                ]
-                
-                results_found = False
-                for selector in result_selectors:
-                    try:
-                        # Use shorter timeout for each selector
-                        await page.wait_for_selector(selector, timeout=timeout//2)
-                        logger.info(f"Search results loaded with selector '{selector}' for {account_name}")
-                        results_found = True
-                        break
-                    except Exception as e:
-                        logger.warning(f"Selector '{selector}' failed for {account_name}: {str(e)}")
-                        continue
+                selector, _ = await self._race_selectors(page, RESULT_SELECTORS, timeout=timeout)
+                results_found = selector is not None
+                if results_found:
+                    logger.info(f"Search results loaded with selector '{selector}' for {account_name}")
                 
                 if not results_found:
                     logger.warning(f"Could not find search results for {account_name}, but continuing anyway")
@@ -743,45 +891,16 @@ class MultiTwitterPlaywright:
                 # Scroll down to load more tweets (fewer scrolls for secondary)
                 scroll_count = 2 if account_name == 'secondary' else 3
                 logger.info(f"Scrolling to load more tweets for {account_name} ({scroll_count} times)...")
-                for i in range(scroll_count):
-                    await page.evaluate("window.scrollBy(0, 1000)")
-                    await page.wait_for_timeout(1500)  # Shorter wait
+                await self._scroll_for_more(page, scroll_count, timeout)
                 
-                # Find tweet like buttons with multiple selectors
+                # Find and click like buttons in a single in-page call instead of a round-trip per button
                 logger.info(f"Looking for like buttons for {account_name}...")
-                like_buttons = []
-                
-                # Try multiple selectors for like buttons
-                selectors = [
-                    '[data-testid="like"]',
-                    '[aria-label*="Like"]',
-                    '[aria-label*="like"]',
-                    '[data-testid="unlike"]',  # In case already liked
-                    'div[role="button"][aria-label*="Like"]',
-                    'div[data-testid="like"]',
-                    'div[aria-label*="Like"]',
-                    'div[role="button"]'  # More generic, then filter
-                ]
+                result = await page.evaluate(
+                    LIKE_TWEETS_JS,
+                    {'selectors': list(LIKE_SELECTORS), 'maxLikes': max_likes}
+                )
                 
-                for selector in selectors:
-                    buttons = await page.query_selector_all(selector)
-                    if buttons:
-                        # Filter buttons to only include like buttons
-                        filtered_buttons = []
-                        for button in buttons:
-                            try:
-                                aria_label = await button.get_attribute('aria-label')
-                                if aria_label and ('like' in aria_label.lower() or 'unlike' in aria_label.lower()):
-                                    filtered_buttons.append(button)
-                            except:
-                                continue
-                        
-                        if filtered_buttons:
-                            logger.info(f"Found {len(filtered_buttons)} like buttons with selector '{selector}' for {account_name}")
-                            like_buttons = filtered_buttons
-                            break
-                
-                if not like_buttons:
+                if not result['found']:
                     logger.warning(f"No like buttons found for {account_name} with any selector")
                     if attempt < max_retries - 1:
                         logger.info(f"Retrying search for {account_name}...")
@@ -790,25 +909,9 @@ class MultiTwitterPlaywright:
                     else:
                         return False
                 
-                # Like up to max_likes tweets
-                liked_count = 0
-                for button in like_buttons[:max_likes]:
-                    try:
-                        # Check if already liked
-                        aria_label = await button.get_attribute('aria-label')
-                        if aria_label and 'Unlike' in aria_label:
-                            logger.info(f"Tweet already liked for {account_name}, skipping")
-                            continue
-                        
-                        await button.click()
-                        liked_count += 1
-                        logger.info(f"Liked tweet {liked_count} for {account_name}")
-                        await page.wait_for_timeout(random.randint(1000, 2000))  # Shorter random delay
-                        
-                    except Exception as e:
-                        logger.warning(f"Error liking tweet for {account_name}: {str(e)}")
-                        continue
-                
+                liked_count = result['liked']
+                logger.info(f"Found {result['found']} like buttons with selector '{result['selector']}' for {account_name}")
+                logger.debug("Skipped %d already liked tweets for %s", result['skipped'], account_name)
                 logger.info(f"Successfully liked {liked_count} tweets with {account_name}")
                 return liked_count > 0  # Return True if we liked at least one tweet
                 
@@ -816,26 +919,58 @@ class MultiTwitterPlaywright:
                 logger.error(f"Error searching and liking tweets with {account_name} (attempt {attempt + 1}): {str(e)}")
                 if attempt < max_retries - 1:
                     logger.info(f"Retrying search for {account_name}...")
-                    await asyncio.sleep(5000)  # Wait before retry
+                    # asyncio.sleep takes seconds, unlike page.wait_for_timeout
+                    await asyncio.sleep(min(60, 5 * 2 ** attempt))  # Back off before retry
                     continue
                 else:
                     return False
         
         return False
 
+    async def warm_up(self):
+        """Start the shared browser and log every account in ahead of the first operation."""
+        try:
+            await self._ensure_playwright()
+            logger.info("Shared browser is warm")
+            logged_in = await self.ensure_all_logged_in()
+            logger.info(f"Warm-up login results: {logged_in}")
+        except Exception as e:
+            logger.error(f"Error warming up browser: {str(e)}")
+
+    async def aclose(self):
+        """Close the account contexts but keep the shared browser running for the next call."""
+        for account_name in list(self.contexts.keys()):
+            try:
+                if self._logged_in.get(account_name):
+                    await self._save_state(account_name)
+                await self.contexts.pop(account_name).close()
+                logger.info(f"Closed browser session for {account_name}")
+            except Exception as e:
+                logger.error(f"Error closing browser for {account_name}: {str(e)}")
+        self.pages.clear()
+        self._logged_in.clear()
+
     async def close_session(self):
         """Close all browser sessions."""
         try:
-            for account_name in list(self.browsers.keys()):
+            await self.aclose()
+            
+            # Disconnects from a shared CDP browser without killing it
+            if self.browser:
+                await self.browser.close()
+                self.browser = None
+            
+            # The advertised browser is gone with us
+            if self._advertised_endpoint:
                 try:
-                    if self.browsers[account_name]:
-                        await self.browsers[account_name].close()
-                    logger.info(f"Closed browser session for {account_name}")
-                except Exception as e:
-                    logger.error(f"Error closing browser for {account_name}: {str(e)}")
+                    os.remove(CDP_ENDPOINT_FILE)
+                except FileNotFoundError:
+                    pass
+                self._advertised_endpoint = False
             
             if self.playwright:
                 await self.playwright.stop()
+                self.playwright = None
                 logger.info("Stopped Playwright")
                 
         except Exception as e:
@@ -846,4 +981,9 @@ class MultiTwitterPlaywright:
         return {
             account_name: self._logged_in.get(account_name, False)
             for account_name in self.accounts.keys()
-        } 
\ No newline at end of file
+        }
+
+@lru_cache(maxsize=1)
+def get_twitter() -> MultiTwitterPlaywright:
+    """Return the process-wide MultiTwitterPlaywright so every caller shares one browser."""
+    return MultiTwitterPlaywright()
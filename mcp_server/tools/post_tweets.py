@@ -1,6 +1,7 @@
 # Placeholder for tweet generation using LLM
 
 import os
+import re
 import time
 import random
 import asyncio
@@ -9,13 +10,16 @@ import logging
 from dotenv import load_dotenv, find_dotenv
 from typing import Optional
 import subprocess
+from common.storage_state import save_storage_state
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Module import runs once per process, so .env is located and parsed only once.
+# Log rather than print: stdout is the MCP stdio transport when the server imports this
 dotenv_path = find_dotenv()
-print("Loading .env from:", dotenv_path)
+logger.debug("Loading .env from: %s", dotenv_path)
 load_dotenv(dotenv_path)
 
 # Get session directory from .env
@@ -23,6 +27,166 @@ SESSION_DIR = os.getenv('PLAYWRIGHT_SESSION_DIR', './playwright_session')
 if not os.path.exists(SESSION_DIR):
     os.makedirs(SESSION_DIR)
 
+# Randomized pauses between likes so the account doesn't act at machine speed
+HUMAN_DELAY = os.getenv('HUMAN_DELAY', 'true').lower() == 'true'
+
+# Comma-joined selectors match whichever variant X renders. The post button list is
+# limited to test ids so the sidebar "Post" button can't be picked up by mistake
+NEXT_BUTTON_SEL = '[data-testid="LoginNextButton"], button:has-text("Next"), div[role="button"]:has-text("Next")'
+PASSWORD_SEL = 'input[name="password"], input[type="password"], input[autocomplete="current-password"]'
+LOGIN_BUTTON_SEL = '[data-testid="LoginForm_Login_Button"], button:has-text("Log in"), div[role="button"]:has-text("Log in")'
+COMPOSE_SEL = '[data-testid="SideNav_NewTweet_Button"], [data-testid="tweetButtonInline"], [data-testid="tweetTextarea_0"]'
+TWEET_INPUT_SEL = '[data-testid="tweetTextarea_0"]'
+POST_BUTTON_SEL = '[data-testid="tweetButton"], [data-testid="tweetButtonInline"]'
+RESULT_SEL = '[data-testid="cellInnerDiv"]'
+LATEST_TAB_SEL = 'div[role="tab"]:has-text("Latest")'
+LOGIN_FORM_SEL = 'input[name="session[username_or_email]"], input[autocomplete="username"]'
+POST_CONFIRM_TIMEOUT = 15000
+
+# Elements that only render for a logged-in session, joined so one query checks them all
+LOGGED_IN_SEL = ', '.join((
+    '[data-testid="tweetTextarea_0"]',  # Tweet composition box
+    '[data-testid="SideNav_NewTweet_Button"]',  # Tweet button in sidebar
+    '[data-testid="primaryColumn"]',  # Main content area
+    '[data-testid="AppTabBar_Home_Link"]',  # Home tab
+    '[data-testid="SideNav_AccountSwitcher_Button"]',  # Account switcher
+))
+LOGIN_VERIFY_SEL = 'div[data-testid="SideNav_AccountSwitcher_Button"], a[href="/home"], div[data-testid="AppTabBar_Home_Link"]'
+
+
+def _is_create_tweet_ok(response) -> bool:
+    """True for the GraphQL CreateTweet mutation returning 200, the ground truth for a post."""
+    return '/CreateTweet' in response.url and response.status == 200
+
+
+# Installed once per context with add_init_script; evaluate calls then send a short
+# call into window.__twitterHelpers instead of re-sending the whole function each time
+HELPERS_JS = """
+window.__twitterHelpers = {
+    isLiked(button) {
+        const svg = button.querySelector('svg');
+        if (!svg) return false;
+        const fill = svg.getAttribute('fill');
+        return fill === 'rgb(249, 24, 128)' || fill === '#F91880';
+    },
+    clickButtonWithText(text) {
+        const button = Array.from(document.querySelectorAll('div[role="button"]'))
+            .find(b => b.textContent.includes(text));
+        if (button) button.click();
+        return !!button;
+    },
+    // Queue like buttons as React adds them instead of rescanning the page after each scroll
+    watchLikes() {
+        this.likeQueue = Array.from(document.querySelectorAll('[data-testid="like"]'));
+        if (this.likeObserver) this.likeObserver.disconnect();
+        this.likeObserver = new MutationObserver(mutations => {
+            for (const mutation of mutations) {
+                for (const node of mutation.addedNodes) {
+                    if (node.nodeType !== Node.ELEMENT_NODE) continue;
+                    if (node.matches('[data-testid="like"]')) this.likeQueue.push(node);
+                    this.likeQueue.push(...node.querySelectorAll('[data-testid="like"]'));
+                }
+            }
+        });
+        this.likeObserver.observe(document.body, {childList: true, subtree: true});
+    },
+    hasNewLikes() {
+        return (this.likeQueue || []).length > 0;
+    },
+    // Read the height and scroll in one round trip; returns the height before scrolling
+    scrollForMore(distance) {
+        const height = document.documentElement.scrollHeight;
+        window.scrollBy(0, distance);
+        return height;
+    },
+    // Drain the queue, dropping buttons React already unmounted and tweets already liked
+    takeNewLikes() {
+        const buttons = (this.likeQueue || []).filter(b => b.isConnected && !this.isLiked(b));
+        this.likeQueue = [];
+        return buttons;
+    },
+};
+"""
+
+# Saved cookies/localStorage from the last successful login
+STATE_PATH = os.getenv('TWITTER_STATE_PATH', os.path.join('.auth', 'twitter.json'))
+
+BROWSER_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-accelerated-2d-canvas',
+    '--disable-gpu',
+    '--window-size=1280,800',
+    '--disable-web-security',
+    '--disable-features=IsolateOrigins,site-per-process'
+]
+
+class BrowserPool:
+    """Process-wide Chromium that hands out isolated contexts.
+    
+    The browser is started on first use and stays up between calls; callers only
+    open and close their own contexts. With PLAYWRIGHT_CDP_ENDPOINT set, the pool
+    attaches to that already running browser instead of launching one.
+    """
+    _instance = None
+
+    def __init__(self):
+        self.playwright = None
+        self.browser = None
+        self.cdp_endpoint = os.getenv('PLAYWRIGHT_CDP_ENDPOINT')
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def instance(cls) -> 'BrowserPool':
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    async def _ensure_browser(self, headless: bool):
+        async with self._lock:
+            if not self.playwright:
+                logger.info("Starting Playwright...")
+                self.playwright = await async_playwright().start()
+            if not self.browser:
+                if self.cdp_endpoint:
+                    logger.info(f"Connecting to shared browser over CDP at {self.cdp_endpoint}")
+                    self.browser = await self.playwright.chromium.connect_over_cdp(self.cdp_endpoint)
+                else:
+                    logger.info(f"Launching shared Chromium (headless={headless})")
+                    self.browser = await self.playwright.chromium.launch(headless=headless, args=BROWSER_ARGS)
+        return self.browser
+
+    async def acquire_context(self, headless: bool = True, **kwargs):
+        """Open a new isolated context in the shared browser.
+        
+        Args:
+            headless: Used only if this call has to launch the browser.
+            **kwargs: Passed through to ``browser.new_context``.
+            
+        Returns:
+            The new BrowserContext.
+        """
+        browser = await self._ensure_browser(headless)
+        return await browser.new_context(**kwargs)
+
+    async def release_context(self, context):
+        """Close a context handed out by acquire_context; the browser stays up."""
+        try:
+            await context.close()
+        except Exception as e:
+            logger.warning(f"Error closing browser context: {str(e)}")
+
+    async def close(self):
+        """Shut down the shared browser and the Playwright driver."""
+        async with self._lock:
+            if self.browser:
+                await self.browser.close()
+                self.browser = None
+            if self.playwright:
+                await self.playwright.stop()
+                self.playwright = None
+
 def is_x_server_running():
     """Check if X Server is running."""
     try:
@@ -37,12 +201,11 @@ class TwitterPlaywright:
         self.password = os.getenv('TWITTER_PASSWORD')
         # Check if X Server is running, if not, force headless mode
         self.headless = not is_x_server_running() or os.getenv('HEADLESS', 'true').lower() == 'true'
-        self.browser = None
         self.context = None
         self.page = None
         self._logged_in = False
         self.max_retries = 3
-        self.playwright = None
+        self._state_path = STATE_PATH
         logger.info(f"TwitterPlaywright initialized with:")
         logger.info(f"- Username: {self.username}")
         logger.info(f"- Headless mode: {self.headless}")
@@ -63,32 +226,20 @@ class TwitterPlaywright:
             logger.info("On login page, not logged in")
             return False
             
-        # Wait a bit for the page to stabilize
-        await self.page.wait_for_timeout(3000)
+        # Let the document finish parsing before probing for elements
+        await self.page.wait_for_load_state('domcontentloaded')
         
         # Check for tweet composition elements that only appear when logged in
-        tweet_indicators = [
-            '[data-testid="tweetTextarea_0"]',  # Tweet composition box
-            '[data-testid="SideNav_NewTweet_Button"]',  # Tweet button in sidebar
-            '[data-testid="primaryColumn"]',  # Main content area
-            '[data-testid="AppTabBar_Home_Link"]',  # Home tab
-            '[data-testid="SideNav_AccountSwitcher_Button"]'  # Account switcher
-        ]
-        
-        for selector in tweet_indicators:
-            try:
-                logger.info(f"Checking for {selector}")
-                element = await self.page.query_selector(selector)
-                if element:
-                    logger.info(f"Found logged-in indicator: {selector}")
-                    return True
-            except Exception as e:
-                logger.warning(f"Error checking {selector}: {str(e)}")
-                continue
+        try:
+            if await self.page.query_selector(LOGGED_IN_SEL):
+                logger.info("Found logged-in indicator")
+                return True
+        except Exception as e:
+            logger.warning(f"Error checking logged-in indicators: {str(e)}")
         
         # If we're on the home page but don't see login form, assume we're logged in
         if 'home' in current_url.lower():
-            login_form = await self.page.query_selector('input[name="session[username_or_email]"], input[autocomplete="username"]')
+            login_form = await self.page.query_selector(LOGIN_FORM_SEL)
             if not login_form:
                 logger.info("On home page with no login form, assuming logged in")
                 return True
@@ -97,35 +248,30 @@ class TwitterPlaywright:
         return False
 
     async def _init_browser(self):
-        """Initialize the browser in persistent context mode."""
+        """Open this session's context in the shared browser, reusing it if already open."""
         try:
-            logger.info("Starting Playwright...")
-            self.playwright = await async_playwright().start()
-
-            logger.info(f"Launching Chromium persistent context (headless={self.headless}) with session dir: {SESSION_DIR}")
-            self.context = await self.playwright.chromium.launch_persistent_context(
-                user_data_dir=SESSION_DIR,
-                headless=self.headless,
-                args=[
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-accelerated-2d-canvas',
-                    '--disable-gpu',
-                    '--window-size=1280,800',
-                    '--disable-web-security',
-                    '--disable-features=IsolateOrigins,site-per-process'
-                ],
-                viewport={'width': 1280, 'height': 800},
-                ignore_https_errors=True
-            )
-
-            logger.info("Creating new page...")
-            self.page = await self.context.new_page()
-
-            # Set default timeout
-            self.page.set_default_timeout(120000)  # Increased timeout to 2 minutes
-            self.page.set_default_navigation_timeout(120000)  # Increased timeout to 2 minutes
+            # A failed login leaves the context open; reuse it instead of leaking a new one per call
+            if self.context is None:
+                logger.info("Acquiring browser context from the shared pool...")
+                # Cookies and localStorage from the last login let warm runs skip the login flow
+                has_state = os.path.exists(self._state_path)
+                if has_state:
+                    logger.info(f"Restoring storage state from {self._state_path}")
+                self.context = await BrowserPool.instance().acquire_context(
+                    headless=self.headless,
+                    storage_state=self._state_path if has_state else None,
+                    viewport={'width': 1280, 'height': 800},
+                    ignore_https_errors=True
+                )
+                await self.context.add_init_script(script=HELPERS_JS)
+
+            if self.page is None or self.page.is_closed():
+                logger.info("Creating new page...")
+                self.page = await self.context.new_page()
+
+                # Set default timeout
+                self.page.set_default_timeout(120000)  # Increased timeout to 2 minutes
+                self.page.set_default_navigation_timeout(120000)  # Increased timeout to 2 minutes
 
             logger.info("Browser initialization complete")
             
@@ -145,13 +291,15 @@ class TwitterPlaywright:
                     except Exception as e:
                         logger.warning(f"Timeout waiting for main content or login form: {str(e)}")
                     
-                    # Additional wait for page stability
-                    await self.page.wait_for_timeout(5000)
-                    
                     # Check if we're actually on the home page
                     current_url = self.page.url
                     logger.info(f"Current URL: {current_url}")
                     
+                    # X redirected us to log in, so there is no session to wait for
+                    if 'login' in current_url.lower():
+                        logger.info("No valid saved session, proceeding with login")
+                        break
+                    
                     if 'home' in current_url.lower():
                         # Use robust login status check
                         login_status = await self.check_login_status()
@@ -160,15 +308,15 @@ class TwitterPlaywright:
                         if login_status:
                             logger.info("Already logged in (session restored)")
                             self._logged_in = True
+                            # Keep the saved cookies as fresh as the ones X just sent
+                            await self._save_storage_state()
                             return
                     
                     if attempt < max_retries - 1:
+                        # The next attempt's goto reloads the page and waits for content itself
                         logger.info("Navigation attempt failed, retrying...")
-                        await self.page.reload()
-                        await self.page.wait_for_timeout(5000)
                     else:
-                        logger.info("All navigation attempts failed, proceeding with login")
-                        await self._login()
+                        logger.info("All navigation attempts failed, will need to login")
                         
                 except Exception as e:
                     logger.warning(f"Navigation attempt {attempt + 1} failed: {str(e)}")
@@ -176,14 +324,37 @@ class TwitterPlaywright:
                         logger.info("Retrying navigation...")
                         await self.page.wait_for_timeout(5000)
                     else:
-                        logger.info("All navigation attempts failed, proceeding with login")
-                        await self._login()
+                        logger.info("All navigation attempts failed, will need to login")
+
+            # The single login fallback for a redirect, a failed probe or an errored restore
+            if not self._logged_in:
+                await self._login()
 
         except Exception as e:
             logger.error(f"Error initializing browser: {str(e)}")
             await self.close_session()  # Ensure cleanup on error
             raise
 
+    async def ensure_logged_in(self) -> bool:
+        """Start the browser and log in unless this session already has."""
+        if not self._logged_in:
+            await self._init_browser()
+        return self._logged_in
+
+    async def _save_storage_state(self):
+        """Persist the current storage state after a successful login."""
+        try:
+            # Written owner-only: session cookies are as good as the password
+            await save_storage_state(self.context, self._state_path)
+            logger.info(f"Saved storage state to {self._state_path}")
+        except Exception as e:
+            logger.warning(f"Could not save storage state to {self._state_path}: {str(e)}")
+
+    async def _human_pause(self, low: int = 1000, high: int = 2000):
+        """Sleep a random low-high ms when HUMAN_DELAY is on; a no-op otherwise."""
+        if HUMAN_DELAY:
+            await self.page.wait_for_timeout(random.randint(low, high))
+
     async def _wait_for_selector(self, selector: str, timeout: int = 30000) -> Optional[any]:
         """Wait for a selector with retry logic."""
         for attempt in range(self.max_retries):
@@ -202,14 +373,18 @@ class TwitterPlaywright:
 
     async def _login(self):
         """Login to Twitter with retry logic."""
+        # Drop cookies from a stale saved session before starting a fresh login
+        if os.path.exists(self._state_path):
+            logger.info("Saved session is stale, logging in again")
+            await self.context.clear_cookies()
+        
         for attempt in range(self.max_retries):
             try:
                 logger.info(f"Login attempt {attempt + 1}/{self.max_retries}")
                 
                 # Navigate to login page
                 logger.info("Navigating to Twitter login page...")
-                await self.page.goto('https://twitter.com/i/flow/login', wait_until='networkidle')
-                await self.page.wait_for_timeout(5000)
+                await self.page.goto('https://twitter.com/i/flow/login', wait_until='domcontentloaded')
                 
                 # Enter username
                 logger.info("Entering username...")
@@ -217,121 +392,49 @@ class TwitterPlaywright:
                 if not username_input:
                     raise Exception("Could not find username input field")
                 await username_input.fill(self.username)
-                await self.page.wait_for_timeout(2000)
                 
-                # Click Next button - try multiple selectors
+                # Click Next button - one composite selector, JS scan only if that misses
                 logger.info("Clicking Next button...")
-                next_button = None
-                
-                # First try data-testid
                 try:
-                    next_button = await self.page.wait_for_selector('[data-testid="LoginNextButton"]', timeout=10000)
-                    if next_button:
-                        await next_button.click()
-                except:
-                    pass
-                
-                # If not found, try role and text
-                if not next_button:
-                    try:
-                        await self.page.get_by_role("button", name="Next").click()
-                        next_button = True
-                    except:
-                        pass
+                    await self.page.locator(NEXT_BUTTON_SEL).first.click(timeout=10000)
+                except TimeoutError:
+                    logger.warning("Next button not found by selector, scanning buttons...")
+                    clicked = await self.page.evaluate('t => window.__twitterHelpers.clickButtonWithText(t)', 'Next')
+                    if not clicked:
+                        raise Exception("Could not find Next button")
                 
-                # If still not found, try text content
-                if not next_button:
-                    try:
-                        await self.page.get_by_text("Next").click()
-                        next_button = True
-                    except:
-                        pass
-                
-                # If still not found, try evaluating JavaScript
-                if not next_button:
-                    try:
-                        next_button = await self.page.evaluate('''() => {
-                            const buttons = Array.from(document.querySelectorAll('div[role="button"]'));
-                            return buttons.find(button => button.textContent.includes('Next'));
-                        }''')
-                        if next_button:
-                            await self.page.click('div[role="button"]:has-text("Next")')
-                            next_button = True
-                    except:
-                        pass
-                
-                if not next_button:
-                    raise Exception("Could not find Next button")
-                
-                # Wait for password field to appear
-                logger.info("Waiting for password field...")
+                # Wait for password field to appear, then enter password
+                logger.info("Entering password...")
                 try:
-                    # Wait for the password field to be visible
-                    await self.page.wait_for_selector('input[name="password"]', state='visible', timeout=10000)
-                    await self.page.wait_for_timeout(2000)  # Additional wait to ensure field is ready
-                except:
+                    password_input = await self.page.wait_for_selector(PASSWORD_SEL, state='visible', timeout=10000)
+                except TimeoutError:
                     logger.error("Password field did not appear after clicking Next")
                     raise Exception("Password field not found")
-                
-                # Enter password
-                logger.info("Entering password...")
-                password_input = await self.page.wait_for_selector('input[name="password"]', timeout=60000)
-                if not password_input:
-                    raise Exception("Could not find password input field")
                 await password_input.fill(self.password)
-                await self.page.wait_for_timeout(2000)
                 
-                # Click Login button - try multiple selectors
+                # Click Login button
                 logger.info("Clicking Login button...")
-                login_button = None
-                
-                # First try data-testid
                 try:
-                    login_button = await self.page.wait_for_selector('[data-testid="LoginForm_Login_Button"]', timeout=10000)
-                    if login_button:
-                        await login_button.click()
-                except:
-                    pass
-                
-                # If not found, try role and text
-                if not login_button:
-                    try:
-                        await self.page.get_by_role("button", name="Log in").click()
-                        login_button = True
-                    except:
-                        pass
-                
-                # If still not found, try text content
-                if not login_button:
-                    try:
-                        await self.page.get_by_text("Log in").click()
-                        login_button = True
-                    except:
-                        pass
-                
-                if not login_button:
+                    await self.page.locator(LOGIN_BUTTON_SEL).first.click(timeout=10000)
+                except TimeoutError:
                     raise Exception("Could not find Login button")
                 
                 # Wait for login to complete
                 logger.info("Waiting for login to complete...")
-                await self.page.wait_for_load_state('networkidle')
-                await self.page.wait_for_timeout(8000)
-                
-                # Verify login success - try multiple selectors
-                for selector in [
-                    'div[data-testid="SideNav_AccountSwitcher_Button"]',
-                    'a[href="/home"]',
-                    'div[data-testid="AppTabBar_Home_Link"]'
-                ]:
-                    try:
-                        if await self.page.wait_for_selector(selector, timeout=10000):
-                            logger.info("Successfully logged into Twitter")
-                            self._logged_in = True
-                            return
-                    except:
-                        continue
+                try:
+                    await self.page.wait_for_url(re.compile(r'/(home|i/timeline)'), timeout=15000)
+                except TimeoutError:
+                    logger.warning("Did not land on the home timeline after login")
                 
-                raise Exception("Login verification failed")
+                # Verify login success - one wait races every marker instead of 10s per selector
+                try:
+                    await self.page.wait_for_selector(LOGIN_VERIFY_SEL, timeout=10000)
+                except TimeoutError:
+                    raise Exception("Login verification failed")
+                logger.info("Successfully logged into Twitter")
+                self._logged_in = True
+                await self._save_storage_state()
+                return
                     
             except TimeoutError as e:
                 logger.error(f"Timeout during Twitter login attempt {attempt + 1}: {str(e)}")
@@ -353,110 +456,46 @@ class TwitterPlaywright:
     async def post_tweet(self, text: str) -> bool:
         """Post a tweet to Twitter."""
         try:
-            if not self._logged_in:
-                await self._init_browser()
+            await self.ensure_logged_in()
             
-            # Try to find the tweet button directly first
+            # Open the composer with whichever entry point renders first
             logger.info("Looking for tweet button...")
             try:
-                # Try the sidebar tweet button first
-                tweet_button = await self.page.query_selector('[data-testid="SideNav_NewTweet_Button"]')
-                if tweet_button:
-                    logger.info("Found sidebar tweet button, clicking...")
-                    await tweet_button.click()
-                    await self.page.wait_for_timeout(2000)
-                else:
-                    # If sidebar button not found, try the floating tweet button
-                    tweet_button = await self.page.query_selector('[data-testid="tweetButtonInline"]')
-                    if tweet_button:
-                        logger.info("Found floating tweet button, clicking...")
-                        await tweet_button.click()
-                        await self.page.wait_for_timeout(2000)
-                    else:
-                        # If no tweet button found, try to click the tweet textarea directly
-                        tweet_textarea = await self.page.query_selector('[data-testid="tweetTextarea_0"]')
-                        if tweet_textarea:
-                            logger.info("Found tweet textarea, clicking...")
-                            await tweet_textarea.click()
-                            await self.page.wait_for_timeout(2000)
-                        else:
-                            # If nothing found, try to navigate to compose tweet URL
-                            logger.info("No tweet buttons found, navigating to compose URL...")
-                            await self.page.goto('https://twitter.com/compose/tweet', wait_until='domcontentloaded', timeout=30000)
-                            await self.page.wait_for_timeout(3000)
+                compose = await self.page.wait_for_selector(COMPOSE_SEL, state='visible', timeout=5000)
+                await compose.click()
             except Exception as e:
-                logger.warning(f"Error finding tweet button: {str(e)}")
-                # Fallback to compose URL
-                logger.info("Falling back to compose URL...")
+                logger.warning(f"No tweet button found, navigating to compose URL: {str(e)}")
                 await self.page.goto('https://twitter.com/compose/tweet', wait_until='domcontentloaded', timeout=30000)
-                await self.page.wait_for_timeout(3000)
             
-            # Wait for tweet compose dialog
-            logger.info("Waiting for tweet compose dialog...")
+            # Wait for tweet compose dialog and enter the text
+            logger.info("Entering tweet text...")
             try:
-                await self.page.wait_for_selector('[data-testid="tweetTextarea_0"]', timeout=10000)
+                tweet_input = await self.page.wait_for_selector(TWEET_INPUT_SEL, timeout=10000)
             except Exception as e:
                 logger.error(f"Could not find tweet textarea: {str(e)}")
                 return False
             
-            # Enter tweet text
-            logger.info("Entering tweet text...")
-            tweet_input = await self.page.wait_for_selector('[data-testid="tweetTextarea_0"]', timeout=10000)
-            if not tweet_input:
-                logger.error("Could not find tweet input field")
-                return False
-            
             await tweet_input.fill(text)
-            await self.page.wait_for_timeout(2000)
+            await self.page.locator(POST_BUTTON_SEL).first.wait_for(state='attached', timeout=10000)
+            
+            # Arm the CreateTweet listener before clicking so a fast response isn't missed
+            created = asyncio.ensure_future(self.page.wait_for_event(
+                'response', predicate=_is_create_tweet_ok, timeout=POST_CONFIRM_TIMEOUT))
             
             # Click post button with multiple approaches
             logger.info("Clicking post button...")
             post_success = False
             
-            # List of possible post button selectors
-            post_button_selectors = [
-                '[data-testid="tweetButton"]',
-                'div[role="button"]:has-text("Post")',
-                'div[role="button"]:has-text("Tweet")',
-                'div[data-testid="tweetButtonInline"]',
-                'div[role="button"][data-testid="tweetButton"]',
-                'div[role="button"][data-testid="tweetButtonInline"]'
-            ]
-            
-            # Try each selector with multiple click methods
-            for selector in post_button_selectors:
+            try:
+                post_button = await self.page.wait_for_selector(POST_BUTTON_SEL, state='visible', timeout=5000)
                 try:
-                    logger.info(f"Trying post button selector: {selector}")
-                    # Wait for button to be visible
-                    post_button = await self.page.wait_for_selector(selector, state='visible', timeout=5000)
-                    if post_button:
-                        # Try multiple click methods
-                        try:
-                            # Method 1: Direct click
-                            await post_button.click()
-                            post_success = True
-                            break
-                        except Exception as e:
-                            logger.warning(f"Direct click failed: {str(e)}")
-                            try:
-                                # Method 2: JavaScript click
-                                await self.page.evaluate('(button) => button.click()', post_button)
-                                post_success = True
-                                break
-                            except Exception as e:
-                                logger.warning(f"JavaScript click failed: {str(e)}")
-                                try:
-                                    # Method 3: Click by text content
-                                    button_text = await post_button.text_content()
-                                    if button_text:
-                                        await self.page.get_by_text(button_text).click()
-                                        post_success = True
-                                        break
-                                except Exception as e:
-                                    logger.warning(f"Text click failed: {str(e)}")
+                    await post_button.click()
                 except Exception as e:
-                    logger.warning(f"Failed with selector {selector}: {str(e)}")
-                    continue
+                    logger.warning(f"Direct click failed, using JavaScript click: {str(e)}")
+                    await self.page.evaluate('(button) => button.click()', post_button)
+                post_success = True
+            except Exception as e:
+                logger.warning(f"Post button not found by selector: {str(e)}")
             
             if not post_success:
                 # Last resort: Try to find and click any button that looks like a post button
@@ -473,40 +512,44 @@ class TwitterPlaywright:
                     logger.warning(f"Last resort button click failed: {str(e)}")
             
             if not post_success:
+                created.cancel()
                 logger.error("Could not click post button")
                 return False
             
             # Wait for post to complete
             logger.info("Waiting for post to complete...")
-            try:
-                await self.page.wait_for_load_state('networkidle', timeout=10000)
-                await self.page.wait_for_timeout(5000)
-                
-                # Verify post was successful
-                try:
-                    # Wait for compose dialog to disappear
-                    await self.page.wait_for_selector('[data-testid="tweetTextarea_0"]', state='hidden', timeout=5000)
-                    logger.info("Tweet posted successfully")
-                    return True
-                except Exception as e:
-                    logger.warning(f"Could not verify post success: {str(e)}")
-                    # Even if we can't verify, assume success
-                    return True
-                    
-            except Exception as e:
-                logger.warning(f"Error during post verification: {str(e)}")
-                # Even if we get an error, assume success
-                return True
+            await self._confirm_post(created)
+            return True
             
         except Exception as e:
             logger.error(f"Error posting tweet: {str(e)}")
             return False
 
+    async def _confirm_post(self, created: asyncio.Future):
+        """Wait for the CreateTweet response or for the composer to close, whichever comes first.
+
+        Twitter sometimes closes the composer before the mutation resolves, and the
+        network event is missed when the page is reused, so either signal counts.
+        An unverified post is still treated as sent, matching the previous behaviour.
+        """
+        closed = asyncio.ensure_future(self.page.locator(TWEET_INPUT_SEL).first.wait_for(
+            state='detached', timeout=POST_CONFIRM_TIMEOUT))
+        done, pending = await asyncio.wait({created, closed}, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        
+        if created in done and not created.exception():
+            logger.info("Tweet posted successfully")
+        elif closed in done and not closed.exception():
+            logger.info("Tweet posted successfully (composer closed)")
+        else:
+            logger.warning("Could not verify post success, assuming it was sent")
+
     async def search_and_like_tweets(self, search_term: str, max_likes: int = 5) -> bool:
         """Search for tweets and like them from the search results page only."""
         try:
-            if not self._logged_in:
-                await self._init_browser()
+            await self.ensure_logged_in()
             
             # Properly encode the search term for URL
             encoded_term = search_term.replace('#', '%23').replace(' ', '%20')
@@ -521,7 +564,6 @@ class TwitterPlaywright:
                 try:
                     logger.info(f"Navigation attempt {attempt + 1}/{max_retries}")
                     await self.page.goto(search_url, wait_until='domcontentloaded', timeout=30000)
-                    await self.page.wait_for_timeout(5000)  # Wait for page to stabilize
                     
                     # Verify we're on the search page
                     current_url = self.page.url
@@ -537,7 +579,7 @@ class TwitterPlaywright:
                     # Wait for search results to load
                     logger.info("Waiting for search results to load...")
                     try:
-                        await self.page.wait_for_selector('[data-testid="cellInnerDiv"]', timeout=30000)
+                        await self.page.wait_for_selector(RESULT_SEL, timeout=30000)
                         logger.info("Search results loaded")
                     except Exception as e:
                         logger.warning(f"Timeout waiting for search results: {str(e)}")
@@ -548,10 +590,10 @@ class TwitterPlaywright:
                     
                     # Click Latest tab if available
                     try:
-                        latest_tab = await self.page.wait_for_selector('div[role="tab"]:has-text("Latest")', timeout=5000)
+                        latest_tab = await self.page.wait_for_selector(LATEST_TAB_SEL, timeout=5000)
                         if latest_tab:
                             await latest_tab.click()
-                            await self.page.wait_for_timeout(3000)
+                            await self.page.wait_for_selector(RESULT_SEL, timeout=10000)
                             logger.info("Clicked Latest tab")
                     except Exception as e:
                         logger.warning(f"Could not click Latest tab: {str(e)}")
@@ -563,18 +605,28 @@ class TwitterPlaywright:
                     last_height = 0
                     no_new_content_count = 0
                     
+                    await self.page.evaluate('() => window.__twitterHelpers.watchLikes()')
+                    
                     while likes_count < max_likes and scroll_attempts < max_scroll_attempts:
                         # Verify we're still on the search page
                         current_url = self.page.url
                         if 'search' not in current_url.lower():
                             logger.warning(f"Navigated away from search page, re-navigating...")
                             await self.page.goto(search_url, wait_until='domcontentloaded', timeout=30000)
-                            await self.page.wait_for_timeout(3000)
+                            await self.page.wait_for_selector(RESULT_SEL, timeout=10000)
+                            await self.page.evaluate('() => window.__twitterHelpers.watchLikes()')
+                            # Count the redirect so repeated ones still end the loop
+                            scroll_attempts += 1
                             continue
                         
-                        # Find like buttons
-                        like_buttons = await self.page.query_selector_all('[data-testid="like"]')
-                        logger.info(f"Found {len(like_buttons)} like buttons")
+                        # Take only the unliked buttons that appeared since the last pass
+                        queue = await self.page.evaluate_handle('() => window.__twitterHelpers.takeNewLikes()')
+                        like_buttons = [
+                            prop.as_element() for prop in (await queue.get_properties()).values()
+                            if prop.as_element()
+                        ]
+                        await queue.dispose()
+                        logger.info(f"Found {len(like_buttons)} new unliked tweets")
                         
                         # Process visible like buttons
                         for button in like_buttons:
@@ -587,27 +639,19 @@ class TwitterPlaywright:
                                 if not is_visible:
                                     continue
                                 
-                                # Check if already liked
-                                is_liked = await button.evaluate('''(button) => {
-                                    const svg = button.querySelector('svg');
-                                    if (!svg) return false;
-                                    const fill = svg.getAttribute('fill');
-                                    return fill === 'rgb(249, 24, 128)' || fill === '#F91880';
-                                }''')
-                                
-                                if not is_liked:
-                                    await button.scroll_into_view_if_needed()
-                                    await self.page.wait_for_timeout(1000)
-                                    await button.click()
-                                    likes_count += 1
-                                    logger.info(f"Liked tweet {likes_count}/{max_likes}")
-                                    await self.page.wait_for_timeout(2000)
+                                await button.scroll_into_view_if_needed()
+                                await button.click()
+                                likes_count += 1
+                                logger.info(f"Liked tweet {likes_count}/{max_likes}")
+                                await self._human_pause()
                             except Exception as e:
                                 logger.warning(f"Error liking tweet: {str(e)}")
                                 continue
                         
-                        # Scroll for more tweets with improved logic
-                        current_height = await self.page.evaluate('document.documentElement.scrollHeight')
+                        # Scroll with variable distance, increasing with each attempt
+                        scroll_distance = 1000 + (scroll_attempts * 200)
+                        current_height = await self.page.evaluate(
+                            'd => window.__twitterHelpers.scrollForMore(d)', scroll_distance)
                         if current_height == last_height:
                             no_new_content_count += 1
                             if no_new_content_count >= 3:  # If no new content after 3 attempts, try a bigger scroll
@@ -615,11 +659,12 @@ class TwitterPlaywright:
                                 no_new_content_count = 0
                         else:
                             no_new_content_count = 0
-                            
-                        # Scroll with variable distance
-                        scroll_distance = 1000 + (scroll_attempts * 200)  # Increase scroll distance with each attempt
-                        await self.page.evaluate(f'window.scrollBy(0, {scroll_distance})')
-                        await self.page.wait_for_timeout(4000)  # Increased wait time for content to load
+                        
+                        # Move on as soon as the observer queues new tweets, up to the old 4s wait
+                        try:
+                            await self.page.wait_for_function('() => window.__twitterHelpers.hasNewLikes()', timeout=4000)
+                        except TimeoutError:
+                            pass
                         
                         last_height = current_height
                         scroll_attempts += 1
@@ -649,15 +694,11 @@ class TwitterPlaywright:
             return False
 
     async def close_session(self):
-        """Close the browser session."""
+        """Close this session's context; the shared browser stays up for the next call."""
         try:
             logger.info("Closing browser session...")
-            if self.browser:
-                await self.browser.close()
-                self.browser = None
-            if self.playwright:
-                await self.playwright.stop()
-                self.playwright = None
+            if self.context:
+                await BrowserPool.instance().release_context(self.context)
             self.context = None
             self.page = None
             self._logged_in = False
@@ -8,6 +8,7 @@ import threading
 import urllib.parse
 import time
 import json
+import base64
 
 # Configure logging
 logging.basicConfig(
@@ -191,8 +192,6 @@ def get_linkedin_person_urn(access_token: str) -> str:
         if len(token_parts) > 1:
             try:
                 # Decode the JWT payload
-                import base64
-                import json
                 payload = json.loads(base64.urlsafe_b64decode(token_parts[1] + '=' * (-len(token_parts[1]) % 4)).decode())
                 person_id = payload.get('sub', '').split(':')[-1]
                 if person_id: